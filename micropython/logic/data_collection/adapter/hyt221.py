@@ -6,7 +6,7 @@ that implements the I2CSensorPort interface, allowing it to be used within
 the application's port-adapter architecture.
 """
 
-from machine import Pin, SoftI2C  # type: ignore
+from machine import Pin, I2C  # type: ignore
 import time
 
 try:
@@ -15,6 +15,42 @@ except ImportError:
     from micropython.logic.data_collection.port.sensorport import I2CSensorPort  # type: ignore
 
 
+# Hardware I2C bus clock; both the HYT221 and INA219 support fast mode
+_I2C_FREQ = 400_000
+
+# Units never change, so every reading shares this table
+_UNITS = {"humidity": "1/100", "temperature": "C"}
+
+# Status bits of the first data byte; both clear means a fresh conversion
+_STATUS_MASK = 0xC0
+# Ready-bit polling: up to 20 reads, 5 ms apart (conversion takes ~60 ms)
+_POLL_TRIES = 20
+_POLL_MS = 5
+
+# Raw 14-bit counts to %RH and degrees C, divided once at import
+_HUMIDITY_SCALE = 100 / 16383.0
+_TEMPERATURE_SCALE = 165 / 16383.0
+
+# Bit unpacking as native code on the device, a plain function on CPython
+# where the repo's micropython package shadows the builtin module
+try:
+    import micropython  # type: ignore
+
+    @micropython.viper
+    def _parse(data: ptr8) -> int:  # noqa: F821
+        # Raw humidity in bits 27..14, raw temperature in bits 13..0
+        humidity = ((data[0] & 0x3F) << 8) | data[1]
+        temperature = (data[2] << 6) | (data[3] >> 2)
+        return (humidity << 14) | temperature
+
+except (ImportError, AttributeError):
+
+    def _parse(data) -> int:
+        humidity = ((data[0] & 0x3F) << 8) | data[1]
+        temperature = (data[2] << 6) | (data[3] >> 2)
+        return (humidity << 14) | temperature
+
+
 class HYT221Adapter(I2CSensorPort):
     """
     Adapter for the HYT221 humidity and temperature sensor.
@@ -24,7 +60,7 @@ class HYT221Adapter(I2CSensorPort):
     and data conversion.
     """
 
-    def __init__(self, sensor, measurement, i2c_address, scl, sda):
+    def __init__(self, sensor, measurement, i2c_address, scl, sda, i2c=None):
         """
         Initialize the HYT221 sensor adapter.
 
@@ -34,12 +70,15 @@ class HYT221Adapter(I2CSensorPort):
             i2c_address: The I2C address of the sensor (default is 0x28)
             scl: The pin number for the I2C clock line
             sda: The pin number for the I2C data line
+            i2c: Optional shared I2C bus; created from scl/sda on first use if None
         """
         self._sensor = sensor
         self._measurement = measurement
         self._i2c_address = i2c_address
         self._scl = scl
         self._sda = sda
+        self._i2c = i2c
+        self._buf = bytearray(4)
 
     @property
     def sensor(self) -> str:
@@ -91,6 +130,12 @@ class HYT221Adapter(I2CSensorPort):
         """
         return self._sda
 
+    def _bus(self):
+        """Return the hardware I2C bus, creating it on first use"""
+        if self._i2c is None:
+            self._i2c = I2C(0, scl=Pin(self._scl), sda=Pin(self._sda), freq=_I2C_FREQ)
+        return self._i2c
+
     def is_ready(self) -> bool:
         """
         Check if the sensor is available on the I2C bus.
@@ -99,8 +144,7 @@ class HYT221Adapter(I2CSensorPort):
             bool: True if sensor responds, False otherwise
         """
         try:
-            i2c = SoftI2C(scl=Pin(self._scl), sda=Pin(self._sda))
-            devices = i2c.scan()
+            devices = self._bus().scan()
             return self._i2c_address in devices
         except Exception:
             return False
@@ -117,22 +161,30 @@ class HYT221Adapter(I2CSensorPort):
                 - error: Error message if reading failed
         """
         try:
-            self._i2c = SoftI2C(scl=Pin(self._scl), sda=Pin(self._sda))
+            i2c = self._bus()
 
             # Trigger a measurement
-            self._i2c.writeto(self._i2c_address, b"\x00")
-            time.sleep(0.1)  # Wait for the measurement to complete
-
-            # Read 4 bytes of data
-            data = self._i2c.readfrom(self._i2c_address, 4)
+            i2c.writeto(self._i2c_address, b"\x00")
+
+            # Read 4 bytes of data as soon as the status bits report them
+            # fresh, into one buffer rather than a new bytes object per poll
+            data = self._buf
+            for _ in range(_POLL_TRIES):
+                time.sleep_ms(_POLL_MS)
+                i2c.readfrom_into(self._i2c_address, data)
+                if not data[0] & _STATUS_MASK:
+                    break
+            else:
+                # Still the previous conversion, not a reading to report
+                print("Error reading HYT221 sensor: conversion timed out")
+                return {"error": "conversion timed out"}
 
             # Parse the data
-            humidity = ((data[0] & 0x3F) << 8) | data[1]
-            temperature = (data[2] << 6) | (data[3] >> 2)
+            raw = _parse(data)
 
             # Convert to human-readable values
-            humidity = humidity * 100 / 16383.0
-            temperature = temperature * 165 / 16383.0 - 40
+            humidity = (raw >> 14) * _HUMIDITY_SCALE
+            temperature = (raw & 0x3FFF) * _TEMPERATURE_SCALE - 40
 
             # Round values to 2 decimal places
             humidity = round(humidity, 2)
@@ -144,7 +196,7 @@ class HYT221Adapter(I2CSensorPort):
                     "humidity": humidity,
                     "temperature": temperature,
                 },
-                "units": {"humidity": "1/100", "temperature": "C"},
+                "units": _UNITS,
             }
         except Exception as e:
             print(f"Error reading HYT221 sensor: {e}")
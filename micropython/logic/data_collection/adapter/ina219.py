@@ -6,8 +6,8 @@ that implements the I2CSensorPort interface, allowing it to be used within
 the application's port-adapter architecture.
 """
 
-from machine import Pin, SoftI2C  # type: ignore
-from ina219 import INA219  # type: ignore
+from machine import Pin, I2C  # type: ignore
+from ina219 import INA219, DeviceRangeError  # type: ignore
 import logging
 
 try:
@@ -16,6 +16,26 @@ except ImportError:
     from micropython.logic.data_collection.port.sensorport import I2CSensorPort  # type: ignore
 
 
+# Hardware I2C bus clock; both the HYT221 and INA219 support fast mode
+_I2C_FREQ = 400_000
+
+# Unit table returned with each reading
+_UNITS = {"voltage": "V", "current": "mA", "power": "mW"}
+
+# INA219 result registers and bus-voltage register layout
+_REG_BUSVOLTAGE = 0x02
+_REG_POWER = 0x03
+_REG_CURRENT = 0x04
+_BUS_VOLTS_LSB = 0.004  # 4 mV per bit, value held in bits 15..3
+_OVF = 0x01
+# Shunt full-scale voltage per gain setting, reported on overflow
+_GAIN_VOLTS = (0.04, 0.08, 0.16, 0.32)
+
+
+def _skip_log(msg, register, value):
+    """Stand-in for register logging when DEBUG is disabled"""
+
+
 class CustomINA219(INA219):
     """
     A customized INA219 implementation to fix compatibility issues with MicroPython.
@@ -24,6 +44,14 @@ class CustomINA219(INA219):
     to ensure proper operation on MicroPython environments with limited resources.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The log level is fixed at construction, so decide once whether
+        # register operations are logged. MicroPython does not mangle names,
+        # so this instance attribute shadows the library's method.
+        if not self._log.isEnabledFor(logging.DEBUG):
+            self.__log_register_operation = _skip_log
+
     def __log_register_operation(self, msg, register, value):
         # performance optimisation
         if self._log.isEnabledFor(logging.DEBUG):
@@ -32,6 +60,42 @@ class CustomINA219(INA219):
                 "%s register 0x%02x: 0x%04x %s", msg, register, value, binary
             )
 
+    def configure(self, *args, **kwargs):
+        """Configure the sensor and precompute the scale factors for read_all"""
+        super().configure(*args, **kwargs)
+        self._current_scale = self._current_lsb * 1000  # mA per bit
+        self._power_scale = self._power_lsb * 1000  # mW per bit
+        self._reg_buf = bytearray(2)
+
+    def _read_raw(self, register):
+        """Read one 16-bit register into the reusable buffer"""
+        buf = self._reg_buf
+        self._i2c.readfrom_mem_into(self._address, register, buf)
+        return (buf[0] << 8) | buf[1]
+
+    def read_all(self):
+        """
+        Read voltage, current and power in three register reads
+
+        The library's voltage(), current() and power() each re-read the bus
+        voltage register for the overflow flag and rescale per call; here the
+        flag comes from the single bus voltage read and the scales are fixed.
+
+        Returns:
+            tuple: (voltage in V, current in mA, power in mW)
+        """
+        bus = self._read_raw(_REG_BUSVOLTAGE)
+        if bus & _OVF:
+            raise DeviceRangeError(_GAIN_VOLTS[self._gain])
+        current = self._read_raw(_REG_CURRENT)
+        if current > 0x7FFF:
+            current -= 0x10000
+        return (
+            (bus >> 3) * _BUS_VOLTS_LSB,
+            current * self._current_scale,
+            self._read_raw(_REG_POWER) * self._power_scale,
+        )
+
 
 class INA219Adapter(I2CSensorPort):
     """
@@ -45,7 +109,7 @@ class INA219Adapter(I2CSensorPort):
     to the common sensor interface used throughout the application.
     """
 
-    def __init__(self, sensor, measurement, i2c_address, scl, sda):
+    def __init__(self, sensor, measurement, i2c_address, scl, sda, i2c=None):
         """
         Initialize the INA219 sensor adapter.
 
@@ -55,12 +119,14 @@ class INA219Adapter(I2CSensorPort):
             i2c_address: The I2C address of the sensor (e.g., 0x40, 0x41)
             scl: The pin number for the I2C clock line
             sda: The pin number for the I2C data line
+            i2c: Optional shared I2C bus; created from scl/sda on first use if None
         """
         self._sensor = sensor
         self._measurement = measurement
         self._i2c_address = i2c_address
         self._scl = scl
         self._sda = sda
+        self._i2c = i2c
         self._shunt_ohms = 0.1  # Standard shunt resistor value
         self._max_expected_amps = 0.2  # Maximum expected current
         self._ina = None
@@ -115,6 +181,12 @@ class INA219Adapter(I2CSensorPort):
         """
         return self._sda
 
+    def _bus(self):
+        """Return the hardware I2C bus, creating it on first use"""
+        if self._i2c is None:
+            self._i2c = I2C(0, scl=Pin(self._scl), sda=Pin(self._sda), freq=_I2C_FREQ)
+        return self._i2c
+
     def is_ready(self) -> bool:
         """
         Check if the sensor is available on the I2C bus.
@@ -125,8 +197,7 @@ class INA219Adapter(I2CSensorPort):
             bool: True if sensor responds, False otherwise
         """
         try:
-            i2c = SoftI2C(scl=Pin(self._scl), sda=Pin(self._sda))
-            devices = i2c.scan()
+            devices = self._bus().scan()
             return self._i2c_address in devices
         except Exception:
             return False
@@ -135,8 +206,9 @@ class INA219Adapter(I2CSensorPort):
         """
         Read voltage, current, and power measurements from the INA219 sensor.
 
-        Configures the INA219 for 16V range and highest precision measurements,
-        then reads voltage, current and power values.
+        Configures the INA219 for 16V range and highest precision measurements
+        on the first read (or after a failed one), then reads voltage, current
+        and power values.
 
         Returns:
             dict: Dictionary containing:
@@ -147,26 +219,28 @@ class INA219Adapter(I2CSensorPort):
                 - error: Error message if reading failed
         """
         try:
-            i2c = SoftI2C(scl=Pin(self._scl), sda=Pin(self._sda))
-            ina = CustomINA219(
-                self._shunt_ohms,
-                i2c,
-                self._max_expected_amps,
-                address=self._i2c_address,
-                log_level=logging.WARNING,
-            )
-
-            ina.configure(
-                voltage_range=ina.RANGE_16V,
-                gain=ina.GAIN_1_40MV,
-                bus_adc=ina.ADC_128SAMP,
-                shunt_adc=ina.ADC_128SAMP,
-            )
+            # The sensor converts continuously, so configuration and
+            # calibration are written once rather than on every read
+            ina = self._ina
+            if ina is None:
+                ina = CustomINA219(
+                    self._shunt_ohms,
+                    self._bus(),
+                    self._max_expected_amps,
+                    address=self._i2c_address,
+                    log_level=logging.WARNING,
+                )
+
+                ina.configure(
+                    voltage_range=ina.RANGE_16V,
+                    gain=ina.GAIN_1_40MV,
+                    bus_adc=ina.ADC_128SAMP,
+                    shunt_adc=ina.ADC_128SAMP,
+                )
+                self._ina = ina
 
             # Get raw values from the sensor
-            voltage = ina.voltage()
-            current = ina.current()
-            power = ina.power()
+            voltage, current, power = ina.read_all()
 
             # Round values to 2 decimal places
             voltage = round(voltage, 2)
@@ -180,9 +254,11 @@ class INA219Adapter(I2CSensorPort):
                     "current": current,
                     "power": power,
                 },
-                "units": {"voltage": "V", "current": "mA", "power": "mW"},
+                "units": _UNITS,
             }
 
         except Exception as e:
+            # Reconfigure on the next read in case the sensor was reset
+            self._ina = None
             print(f"Error reading INA219 sensor: {e}")
             return {"error": str(e)}
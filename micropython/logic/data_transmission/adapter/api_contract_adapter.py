@@ -17,6 +17,122 @@ except ImportError:
     )  # type: ignore
 
 
+# Payload keys, defined once so every lookup shares the same string object
+_K_MEASUREMENTS = "measurements"
+_K_UNITS = "units"
+_K_METADATA = "metadata"
+_K_MEASUREMENT = "measurement"
+_K_ERROR = "error"
+_K_TEMPERATURE = "temperature"
+_K_HUMIDITY = "humidity"
+_K_VOLTAGE = "voltage"
+_K_CURRENT = "current"
+_K_POWER = "power"
+_K_DEVICE_ID = "device_id"
+_K_TIMESTAMP = "timestamp"
+_K_LOCATION = "location"
+_K_VERSION = "version"
+
+
+# Payload skeleton, copied per reading so the dict is allocated at full size
+_PAYLOAD_TEMPLATE = {_K_MEASUREMENTS: None, _K_UNITS: None, _K_METADATA: None}
+
+# Field tables behind the validator's error messages, which names the fields
+# missing or holding the wrong type
+_TOP_SET = frozenset((_K_MEASUREMENTS, _K_UNITS, _K_METADATA))
+_MEASUREMENT_SET = frozenset(
+    (_K_TEMPERATURE, _K_HUMIDITY, _K_VOLTAGE, _K_CURRENT, _K_POWER)
+)
+_METADATA_SET = frozenset((_K_DEVICE_ID, _K_TIMESTAMP, _K_LOCATION, _K_VERSION))
+_METADATA_TYPES = (
+    (_K_DEVICE_ID, str),
+    (_K_TIMESTAMP, int),
+    (_K_LOCATION, str),
+    (_K_VERSION, str),
+)
+
+# (key, error message) pairs coerced to float when building measurements
+_HYT_COERCIONS = (
+    (_K_TEMPERATURE, "temperature must be a number"),
+    (_K_HUMIDITY, "humidity must be a number"),
+)
+_INA_COERCIONS = (
+    (_K_VOLTAGE, "voltage must be a number"),
+    (_K_CURRENT, "current must be a number"),
+    (_K_POWER, "power must be a number"),
+)
+
+
+def _reports_error(reading):
+    """Whether a sensor reading is an error result instead of measurements"""
+    if not reading:
+        return False
+    return _K_ERROR in reading or _K_ERROR in reading.get(_K_MEASUREMENTS, ())
+
+
+def _missing(fields, container):
+    """Slow path: list the fields absent from container for the error message"""
+    return ", ".join(sorted(fields.difference(container)))
+
+
+def _wrong_types(metadata):
+    """Slow path: describe the metadata fields holding the wrong type"""
+    wrong = []
+    for field, expected in _METADATA_TYPES:
+        actual = type(metadata[field])
+        if actual is not expected:
+            wrong.append(
+                f"{field} (expected {expected.__name__}, got {actual.__name__})"
+            )
+    return ", ".join(wrong)
+
+
+def _validate_fast(p):
+    """
+    Check a payload against the field tables, returning it unchanged
+
+    The checks are written out as plain ``in``/``type() is`` tests so the
+    hot path builds no lists and runs no loops; error text is only assembled
+    by the slow-path helpers once a check has already failed.
+    """
+    if type(p) is not dict:
+        raise ValueError("Payload must be a dictionary")
+    if not (_K_MEASUREMENTS in p and _K_UNITS in p and _K_METADATA in p):
+        raise ValueError("Missing required data: " + _missing(_TOP_SET, p))
+    m = p[_K_MEASUREMENTS]
+    if type(m) is not dict:
+        raise ValueError(
+            "Invalid measurements field: 'measurements' must be a dictionary"
+        )
+    if not (
+        _K_TEMPERATURE in m
+        and _K_HUMIDITY in m
+        and _K_VOLTAGE in m
+        and _K_CURRENT in m
+        and _K_POWER in m
+    ):
+        raise ValueError(
+            "Missing required measurements fields: " + _missing(_MEASUREMENT_SET, m)
+        )
+    d = p[_K_METADATA]
+    if type(d) is not dict:
+        raise ValueError("Invalid metadata field: 'metadata' must be a dictionary")
+    if not (
+        _K_DEVICE_ID in d and _K_TIMESTAMP in d and _K_LOCATION in d and _K_VERSION in d
+    ):
+        raise ValueError(
+            "Missing required measurements fields: " + _missing(_METADATA_SET, d)
+        )
+    if not (
+        type(d[_K_DEVICE_ID]) is str
+        and type(d[_K_TIMESTAMP]) is int
+        and type(d[_K_LOCATION]) is str
+        and type(d[_K_VERSION]) is str
+    ):
+        raise ValueError("Metadata fields with incorrect types: " + _wrong_types(d))
+    return p
+
+
 class ApiContractAdapter(ApiValidationPort):
     """
     Implementation of API contract creation.
@@ -25,6 +141,30 @@ class ApiContractAdapter(ApiValidationPort):
     in the OpenAPI specification.
     """
 
+    # Only the cached device id lives on the instance
+    __slots__ = ("_device_id",)
+
+    # Module-level validator shared by every adapter instance
+    _validate_fast = staticmethod(_validate_fast)
+
+    def __init__(self, device_id):
+        """
+        Initialize the adapter
+
+        Args:
+            device_id: Fixed device identifier. It is cast to str once here
+                and used whenever the metadata does not carry its own id.
+
+        Raises:
+            ValueError: If device_id is missing or empty
+        """
+        # Checked here once: the trusted send path never validates payloads
+        if not device_id:
+            raise ValueError("device_id is required")
+        if type(device_id) is not str:
+            device_id = str(device_id)
+        self._device_id = device_id
+
     def validate_payload(self, payload: dict) -> dict:
         """
         Validate essential requirements for API compatibility
@@ -41,81 +181,7 @@ class ApiContractAdapter(ApiValidationPort):
         Raises:
             ValueError: If payload is critically invalid
         """
-        try:
-            # Check payload is a dictionary
-            if not isinstance(payload, dict):
-                raise ValueError("Payload must be a dictionary")
-
-            # Check for required fields
-            expected_fields = ["measurements", "units", "metadata"]
-            available_fields = [data for data in expected_fields if data not in payload]
-
-            if available_fields:
-                raise ValueError(
-                    "Missing required data: " + ", ".join(available_fields)
-                )
-
-            try:
-                measurements = payload.get("measurements", {})
-                if not isinstance(measurements, dict):
-                    raise ValueError("'measurements' must be a dictionary")
-            except Exception as e:
-                raise ValueError(f"Invalid measurements field: {e}")
-
-            # Check that measurements fields are present
-            expected_fields = ["temperature", "humidity", "voltage", "current", "power"]
-            available_fields = [
-                field for field in expected_fields if field not in measurements
-            ]
-            if available_fields:
-                raise ValueError(
-                    "Missing required measurements fields: "
-                    + ", ".join(available_fields)
-                )
-
-            try:
-                metadata = payload.get("metadata", {})
-                if not isinstance(metadata, dict):
-                    raise ValueError("'metadata' must be a dictionary")
-            except Exception as e:
-                raise ValueError(f"Invalid metadata field: {e}")
-
-            # Check that measurements fields are present
-            expected_fields = ["device_id", "timestamp", "location", "version"]
-            available_fields = [
-                field for field in expected_fields if field not in metadata
-            ]
-            if available_fields:
-                raise ValueError(
-                    "Missing required measurements fields: "
-                    + ", ".join(available_fields)
-                )
-
-            # Check that measurements fields are present
-            expected_types = {
-                "device_id": str,
-                "timestamp": int,
-                "location": str,
-                "version": str,
-            }
-            wrong_types = []
-            for field, expected_type in expected_types.items():
-                if field in metadata:
-                    if not isinstance(metadata[field], expected_type):
-                        wrong_types.append(
-                            f"{field} (expected {expected_type.__name__}, got {type(metadata[field]).__name__})"
-                        )
-
-            if wrong_types:
-                raise ValueError(
-                    "Metadata fields with incorrect types: " + ", ".join(wrong_types)
-                )
-
-            return payload
-        except ValueError:
-            raise
-        except Exception as e:
-            raise ValueError(f"Validation error: {e}")
+        return self._validate_fast(payload)
 
     def create_sensor_payload(
         self,
@@ -139,180 +205,150 @@ class ApiContractAdapter(ApiValidationPort):
         Raises:
             ValueError: If parameters are invalid
         """
+        measurements = self._build_measurements(hyt221, ina219_1, ina219_2)
+        payload = self._build_payload(
+            measurements, self._build_units(hyt221, ina219_1, ina219_2), metadata
+        )
+
+        # Validate metadata
+        metadata = payload[_K_METADATA]
+        if _K_DEVICE_ID not in metadata:
+            raise ValueError("Missing device_id in metadata.")
+
+        if _K_TIMESTAMP not in metadata:
+            raise ValueError("Missing timestamp in metadata.")
+
+        if _K_LOCATION not in metadata:
+            raise ValueError("Missing location in metadata.")
+
+        if _K_VERSION not in metadata:
+            raise ValueError("Missing version in metadata.")
+
+        # Final validation
+        return self.validate_payload(payload)
+
+    def create_sensor_payload_fast(
+        self,
+        hyt221: dict,
+        ina219_1: dict,
+        ina219_2: dict,
+        metadata: dict,
+    ) -> dict:
+        """
+        Create a sensor reading payload without the defensive checks
+
+        Intended for trusted internal callers that own well-formed sensor
+        readings and metadata. External input must go through
+        create_sensor_payload, which validates the result. A reading that
+        reports a sensor error also goes through create_sensor_payload, so
+        a payload missing its fields raises instead of being sent.
+
+        Args:
+            hyt221: Dictionary containing HYT221 sensor data (temperature, humidity)
+            ina219_1: Dictionary containing the first INA219 sensor data
+            ina219_2: Dictionary containing the second INA219 sensor data
+            metadata: Dictionary containing the reading metadata
+
+        Returns:
+            Dictionary: Sensor reading payload
+
+        Raises:
+            ValueError: If a failed sensor reading leaves the payload invalid
+        """
+        if (
+            _reports_error(hyt221)
+            or _reports_error(ina219_1)
+            or _reports_error(ina219_2)
+        ):
+            return self.create_sensor_payload(hyt221, ina219_1, ina219_2, metadata)
+        return self._build_payload(
+            self._build_measurements(hyt221, ina219_1, ina219_2),
+            self._build_units(hyt221, ina219_1, ina219_2),
+            metadata,
+        )
+
+    def _build_measurements(self, hyt221: dict, ina219_1: dict, ina219_2: dict) -> dict:
+        """Merge the HYT221 and INA219 readings into the measurements object"""
+        # Create measurements object
+        measurements: Dict[str, Any] = {}
+
+        # Extract HYT221 data (temperature and humidity)
+        if hyt221 and _K_MEASUREMENTS in hyt221:
+            hyt_measurements = hyt221[_K_MEASUREMENTS]
+            try:
+                for key, message in _HYT_COERCIONS:
+                    if key in hyt_measurements:
+                        measurements[key] = float(hyt_measurements[key])
+            except (TypeError, ValueError):
+                raise ValueError(message)
+
+        # Extract INA219 data (measurement, voltage, current, power)
+        for label, fallback, ina219 in (
+            ("INA219_1", "Battery", ina219_1),
+            ("INA219_2", "PV", ina219_2),
+        ):
+            self._absorb_ina(ina219, label, fallback, measurements)
+
+        return measurements
+
+    def _absorb_ina(
+        self, ina219: dict, label: str, fallback: str, measurements: dict
+    ) -> None:
+        """
+        Add one INA219 reading to the measurements object
+
+        Args:
+            ina219: INA219 sensor data
+            label: Sensor label used in warnings and errors
+            fallback: Measurement name zeroed when the sensor reported an error
+            measurements: Measurements object to update in place
+        """
+        if not ina219 or _K_MEASUREMENTS not in ina219:
+            return
+        ina_measurements = ina219[_K_MEASUREMENTS]
+
+        # Check if sensor reading failed
+        if _K_ERROR in ina_measurements:
+            print(f"Warning: {label} sensor error: {ina_measurements[_K_ERROR]}")
+            # Set default values for failed sensor
+            for key, _ in _INA_COERCIONS:
+                measurements.setdefault(key, {})[fallback] = 0.0
+            return
+
+        measurement_name = ina_measurements.get(_K_MEASUREMENT, "Unknown")
+        if not measurement_name and _K_MEASUREMENT in ina_measurements:
+            raise ValueError(
+                f"measurement name is missing in {label.lower()} measurements"
+            )
+
         try:
-            # Create measurements object
-            measurements: Dict[str, Any] = {}
-
-            # Extract HYT221 data (temperature and humidity)
-            if hyt221 and "measurements" in hyt221:
-                hyt_measurements = hyt221.get("measurements", {})
-
-                # Process temperature
-                if "temperature" in hyt_measurements:
-                    try:
-                        measurements["temperature"] = float(
-                            hyt_measurements["temperature"]
-                        )
-                    except (TypeError, ValueError):
-                        raise ValueError("temperature must be a number")
-
-                # Process humidity
-                if "humidity" in hyt_measurements:
-                    try:
-                        measurements["humidity"] = float(hyt_measurements["humidity"])
-                    except (TypeError, ValueError):
-                        raise ValueError("humidity must be a number")
-
-            # Extract INA219 data (measurement, voltage, current, power)
-            if ina219_1 and "measurements" in ina219_1:
-                ina_measurements = ina219_1.get("measurements", {})
-
-                # Check if sensor reading failed
-                if "error" in ina_measurements:
-                    print(
-                        f"Warning: INA219_1 sensor error: {ina_measurements['error']}"
-                    )
-                    # Set default values for failed sensor
-                    measurements.setdefault("voltage", {})["Battery"] = 0.0
-                    measurements.setdefault("current", {})["Battery"] = 0.0
-                    measurements.setdefault("power", {})["Battery"] = 0.0
-                else:
-                    measurement_name = ina_measurements.get("measurement", "Unknown")
-                    if not measurement_name and "measurement" in ina_measurements:
-                        raise ValueError(
-                            "measurement name is missing in ina219_1 measurements"
-                        )
-
-                    # Process voltage
-                    if "voltage" in ina_measurements:
-                        try:
-                            # Ensure we're working with a dictionary of the right type
-                            if "voltage" not in measurements:
-                                measurements["voltage"] = {}
-
-                            # Now we can safely add the value
-                            voltage_value = float(ina_measurements["voltage"])
-                            measurements["voltage"][measurement_name] = voltage_value
-                        except (TypeError, ValueError):
-                            raise ValueError("voltage must be a number")
-
-                    # Process current
-                    if "current" in ina_measurements:
-                        try:
-                            # Ensure we're working with a dictionary of the right type
-                            if "current" not in measurements:
-                                measurements["current"] = {}
-
-                            # Now we can safely add the value
-                            current_value = float(ina_measurements["current"])
-                            measurements["current"][measurement_name] = current_value
-                        except (TypeError, ValueError):
-                            raise ValueError("current must be a number")
-
-                    # Process power
-                    if "power" in ina_measurements:
-                        try:
-                            # Ensure we're working with a dictionary of the right type
-                            if "power" not in measurements:
-                                measurements["power"] = {}
-
-                            power_value = float(ina_measurements["power"])
-                            measurements["power"][measurement_name] = power_value
-                        except (TypeError, ValueError):
-                            raise ValueError("power must be a number")
-
-            # Extract INA219 data from second sensor
-            if ina219_2 and "measurements" in ina219_2:
-                ina_measurements = ina219_2.get("measurements", {})
-
-                # Check if sensor reading failed
-                if "error" in ina_measurements:
-                    print(
-                        f"Warning: INA219_2 sensor error: {ina_measurements['error']}"
-                    )
-                    # Set default values for failed sensor
-                    measurements.setdefault("voltage", {})["PV"] = 0.0
-                    measurements.setdefault("current", {})["PV"] = 0.0
-                    measurements.setdefault("power", {})["PV"] = 0.0
-                else:
-                    measurement_name = ina_measurements.get("measurement", "Unknown")
-                    if not measurement_name and "measurement" in ina_measurements:
-                        raise ValueError(
-                            "measurement name is missing in ina219_2 measurements"
-                        )
-
-                    # Process voltage for second sensor
-                    if "voltage" in ina_measurements:
-                        try:
-                            if "voltage" not in measurements:
-                                measurements["voltage"] = {}
-
-                            voltage_value = float(ina_measurements["voltage"])
-                            measurements["voltage"][measurement_name] = voltage_value
-                        except (TypeError, ValueError):
-                            raise ValueError("voltage must be a number")
-
-                    # Process current for second sensor
-                    if "current" in ina_measurements:
-                        try:
-                            if "current" not in measurements:
-                                measurements["current"] = {}
-
-                            current_value = float(ina_measurements["current"])
-                            measurements["current"][measurement_name] = current_value
-                        except (TypeError, ValueError):
-                            raise ValueError("current must be a number")
-
-                    # Process power for second sensor
-                    if "power" in ina_measurements:
-                        try:
-                            # Ensure we're working with a dictionary of the right type
-                            if "power" not in measurements:
-                                measurements["power"] = {}
-
-                            # Now we can safely add the value
-                            power_value = float(ina_measurements["power"])
-                            measurements["power"][measurement_name] = power_value
-                        except (TypeError, ValueError):
-                            raise ValueError("power must be a number")
-
-            # Validate metadata
-            if "device_id" not in metadata:
-                raise ValueError("Missing device_id in metadata.")
-
-            if "timestamp" not in metadata:
-                raise ValueError("Missing timestamp in metadata.")
-
-            if "location" not in metadata:
-                raise ValueError("Missing location in metadata.")
-
-            if "version" not in metadata:
-                raise ValueError("Missing version in metadata.")
-
-            # Add units
-            units = {}
-
-            # Add units from HYT221
-            if hyt221 and "units" in hyt221:
-                units.update(hyt221.get("units", {}))
-
-            # Add units from INA219
-            if ina219_1 and "units" in ina219_1:
-                units.update(ina219_1.get("units", {}))
-
-            # Create the payload structure
-            payload = {
-                "measurements": measurements,
-                "units": units,
-                "metadata": metadata,
-            }
-
-            # Final validation
-            return self.validate_payload(payload)
-
-        except ValueError as ve:
-            # Re-raise validation errors
-            raise ValueError(f"Payload validation error: {ve}")
-        except Exception as e:
-            # Convert unexpected errors
-            raise ValueError(f"Error creating sensor payload: {str(e)}")
+            for key, message in _INA_COERCIONS:
+                if key in ina_measurements:
+                    value = float(ina_measurements[key])
+                    measurements.setdefault(key, {})[measurement_name] = value
+        except (TypeError, ValueError):
+            raise ValueError(message)
+
+    def _build_units(self, hyt221: dict, ina219_1: dict, ina219_2: dict) -> dict:
+        """Merge the unit tables of all sensor readings"""
+        # Add units from HYT221 and INA219 sensors in a single pass.
+        # Sources are merged in order, so a later source overrides an
+        # earlier one for the same key: INA219_2's units win over INA219_1's.
+        units = {}
+        for source in (hyt221, ina219_1, ina219_2):
+            if source and _K_UNITS in source:
+                units.update(source[_K_UNITS])
+
+        return units
+
+    def _build_payload(self, measurements: dict, units: dict, metadata: dict) -> dict:
+        """Assemble the payload structure, leaving the caller's metadata as is"""
+        if _K_DEVICE_ID not in metadata:
+            metadata = dict(metadata)
+            metadata[_K_DEVICE_ID] = self._device_id
+
+        payload = _PAYLOAD_TEMPLATE.copy()
+        payload[_K_MEASUREMENTS] = measurements
+        payload[_K_UNITS] = units
+        payload[_K_METADATA] = metadata
+        return payload
@@ -5,16 +5,67 @@ This module provides an adapter for sending data over HTTP/HTTPS.
 """
 
 # Mulit env lib import
+import time
+
+try:
+    import uerrno as errno  # type: ignore
+except ImportError:
+    import errno
+
+# The blocking path relies on MicroPython's stream sockets (write, readline,
+# ssl.wrap_socket). CPython's socket and ssl are imported only so the unit
+# tests, which replace the socket, can import this module; they cannot send.
+try:
+    import usocket as socket  # type: ignore
+except ImportError:
+    import socket
+
 try:
-    import urequests as request  # type: ignore
+    import ussl as ssl  # type: ignore
 except ImportError:
-    pass
+    import ssl
 
 try:
     import ujson as json  # type: ignore
 except ImportError:
     import json
 
+try:
+    import uasyncio as asyncio  # type: ignore
+except ImportError:
+    import asyncio
+
+# Gzip encoder, deflate on MicroPython and the gzip module on CPython. None
+# when neither is available, in which case bodies are sent uncompressed.
+try:
+    import io
+
+    import deflate  # type: ignore
+
+    def _gzip(data):
+        buffer = io.BytesIO()
+        stream = deflate.DeflateIO(buffer, deflate.GZIP)
+        stream.write(data)
+        stream.close()
+        return buffer.getvalue()
+
+except ImportError:
+    try:
+        from gzip import compress as _gzip
+    except ImportError:
+        _gzip = None
+
+# Compact JSON without the default ", " and ": " padding, older firmware
+# without the separators argument falls back to the plain encoder
+try:
+    json.dumps(None, separators=(",", ":"))
+
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
+except TypeError:
+    _dumps = json.dumps
+
 try:
     import network  # type: ignore
 except ImportError:
@@ -34,20 +85,93 @@ except ImportError:
     network = NetworkModule()
 
 try:
-    from data_transmission.port.transmissionport import TransmissionPort  # type: ignore
+    from data_transmission.port.transmissionport import AsyncTransmissionPort  # type: ignore
 except ImportError:
     from micropython.logic.data_transmission.port.transmissionport import (
-        TransmissionPort,
+        AsyncTransmissionPort,
     )  # type: ignore
 
 
-class HttpAdapter(TransmissionPort):
+# Code emitters on the device, plain functions on CPython where the repo's
+# micropython package shadows the builtin module
+try:
+    import micropython  # type: ignore
+
+    _native = micropython.native
+
+    @micropython.viper
+    def _is_2xx(status_code: int) -> bool:
+        # One unsigned compare: anything below 200 wraps to a huge value
+        return uint(status_code - 200) < uint(100)  # noqa: F821
+
+except (ImportError, AttributeError):
+
+    def _native(func):
+        return func
+
+    def _is_2xx(status_code: int) -> bool:
+        return 200 <= status_code < 300
+
+
+# Largest response body read into memory, API replies are far smaller
+_MAX_BODY = 512
+
+# Bodies shorter than this are not worth the gzip header and CPU time
+_MIN_COMPRESS = 200
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+class _Response:
+    """Status code and bounded body of one HTTP response"""
+
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+
+    def close(self):
+        # The body is already read and the socket stays with the adapter
+        pass
+
+
+class _ResponseHead:
+    """Status code and framing headers of a response, fed one line at a time"""
+
+    def __init__(self, status_line: bytes):
+        if not status_line:
+            raise OSError("Connection closed by server")
+        self.status_code = int(status_line.split(None, 2)[1])
+        self.length = 0
+        self.chunked = False
+        self.keep_alive = True
+
+    def feed(self, line: bytes) -> bool:
+        """Consume one header line, returns False at the end of the headers"""
+        if not line or line == b"\r\n":
+            return False
+        name, _, value = line.partition(b":")
+        name = name.strip().lower()
+        if name == b"content-length":
+            self.length = int(value)
+        elif name == b"transfer-encoding":
+            self.chunked = b"chunked" in value.lower()
+        elif name == b"connection":
+            self.keep_alive = value.strip().lower() != b"close"
+        return True
+
+
+class HttpAdapter(AsyncTransmissionPort):
     """
     HTTP/HTTPS adapter for data transmission.
 
-    Implements the TransmissionPort interface using the urequests library.
+    Implements the AsyncTransmissionPort interface over a raw socket. The
+    TCP/TLS connection is kept alive between requests and only reopened when
+    the server closes it or a write fails. The coroutine variants use their
+    own asyncio stream so they never block the event loop.
     """
 
+    # Request logging, off by default to save string builds and console writes
+    DEBUG = False
+
     def __init__(
         self,
         name: str,
@@ -55,6 +179,10 @@ class HttpAdapter(TransmissionPort):
         api_key: str,
         headers: dict,
         timeout: int = 15,
+        max_queue: int = 8,
+        compress: bool = False,
+        probe_ttl: int = 30,
+        spool_path: str = None,
     ):
         """
         Initialize HTTP adapter with server details.
@@ -65,83 +193,157 @@ class HttpAdapter(TransmissionPort):
             api_key: Optional API key for authentication (X-API-Key header)
             headers: Optional HTTP headers to include
             timeout: Request timeout in seconds
+            max_queue: Number of unsent payloads kept for the next successful send
+            compress: Gzip request bodies, the API must accept Content-Encoding gzip
+            probe_ttl: Seconds a successful connection test or send stays valid
+            spool_path: Flash file mirroring the outbox so unsent payloads
+                survive a reboot, None keeps the outbox in RAM only
         """
-        self._name = name
+        self.name = name
+
+        # Station interface handle, reused by every readiness check
+        self._wlan = network.WLAN(network.STA_IF)
+
+        # Serialized payloads that could not be delivered, oldest first
+        self._outbox = []
+        self._max_queue = max_queue
+        self._spool_path = spool_path
+        if spool_path is not None:
+            self._load_spool()
+        self._compress = compress and _gzip is not None
+
+        # Time of the last proof that the server is reachable, None when stale
+        self._probe_ttl = probe_ttl
+        self._reached_at = None
 
         # Ensure endpoint doesn't end with a slash
-        self._endpoint = endpoint.rstrip("/")
-        self._readings_endpoint = self._endpoint
+        self.endpoint = endpoint.rstrip("/")
+        self._readings_endpoint = self.endpoint
+        self._send_log = "Sending POST data to " + self._readings_endpoint
         self._timeout = timeout
 
-        # Initialize headers
-        self._headers = headers or {}
-        if "Content-Type" not in self._headers:
-            self._headers["Content-Type"] = "application/json"
+        # Initialize headers. They are built once into our own dict and sent
+        # as-is on every request, the caller's dict is never mutated.
+        self._headers = dict(headers) if headers else {}
+        self._headers.setdefault("Content-Type", "application/json")
 
-        # Add Connection close header to prevent keep-alive issues
-        if "Connection" not in self._headers:
-            self._headers["Connection"] = "close"
+        # Keep the connection open so the next send skips the TLS handshake
+        self._headers.setdefault("Connection", "keep-alive")
 
         # Add API key to X-API-Key header if provided (ApiKeyAuth scheme)
         if api_key:
             self._headers["X-API-Key"] = api_key
 
-        # Extract host from endpoint for proper Host header
-        try:
-            # Parse the URL to extract host
-            if "://" in self._endpoint:
-                # Extract host from full URL
-                host_part = self._endpoint.split("://")[1].split("/")[0]
-                self._headers["Host"] = host_part
-        except Exception:
-            pass  # If parsing fails, skip adding Host header
-
-    @property
-    def name(self):
-        return self._name
-
-    @property
-    def endpoint(self):
-        return self._endpoint
-
+        # Parse the endpoint once, the connection details never change
+        scheme, _, rest = self.endpoint.partition("://")
+        if not rest:
+            scheme, rest = "http", scheme
+        host_part, _, path = rest.partition("/")
+        self._headers["Host"] = host_part
+        self._tls = scheme == "https"
+        self._path = "/" + path
+        host, _, port = host_part.partition(":")
+        self._host = host
+        self._port = int(port) if port else (443 if self._tls else 80)
+        self._address = None
+        self._sock = None
+        self._stream = None
+
+        # Request line and header lines are serialized once per method and
+        # written as a single buffer per request
+        header_block = "".join(
+            [f"{key}: {value}\r\n" for key, value in self._headers.items()]
+        ).encode()
+        self._request_heads = {
+            method: f"{method} {self._path} HTTP/1.1\r\n".encode() + header_block
+            for method in ("GET", "POST")
+        }
+
+    @_native
     def is_ready(self):
         """Check if network is available"""
         try:
-            wlan = network.WLAN(network.STA_IF)
-            return wlan.isconnected()
+            return self._wlan.isconnected()
         except Exception:
             return False
 
+    @_native
     def test_connection(self):
         """Test server connection with a simple request to the readings endpoint"""
         if not self.is_ready():
             return False
+        if self._recently_reached():
+            return True
 
         try:
             # For AWS API Gateway, HEAD requests might not be supported or might require different auth
             # Try a simple GET request instead (should return 405 Method Not Allowed but still indicates connection)
-            print(f"Testing connection to: {self._readings_endpoint}")
-            print(f"Test headers: {self._headers}")
-
-            response = request.get(
-                self._readings_endpoint, headers=self._headers, timeout=self._timeout
-            )
-
-            print(f"Test connection response: {response.status_code}")
-
-            # Accept 405 (Method Not Allowed) as a valid response since we're testing connectivity
-            # Accept 401/403 as valid connection but auth issue
-            success = (200 <= response.status_code < 300) or response.status_code in [
-                401,
-                403,
-                405,
-            ]
+            if HttpAdapter.DEBUG:
+                print(f"Testing connection to: {self._readings_endpoint}")
+
+            response = self._send_request("GET")
+
+            if HttpAdapter.DEBUG:
+                print(f"Test connection response: {response.status_code}")
+
             response.close()
-            return success
+            return self._note_reachable(self._reachable(response.status_code))
+        except Exception as e:
+            print(f"Connection test failed: {e}")
+            return False
+
+    async def test_connection_async(self):
+        """Coroutine variant of test_connection"""
+        if not self.is_ready():
+            return False
+        if self._recently_reached():
+            return True
+
+        try:
+            response = await self._send_request_async("GET")
+            return self._note_reachable(self._reachable(response.status_code))
         except Exception as e:
             print(f"Connection test failed: {e}")
             return False
 
+    async def warmup_async(self) -> bool:
+        """
+        Open the kept-alive stream ahead of the next asynchronous send
+
+        Resolving the host and completing the TCP/TLS handshake here lets the
+        caller overlap them with other work, such as reading the sensors.
+
+        Returns:
+            bool: True when a stream is open and ready for send_data_async
+        """
+        if self._stream is not None:
+            return True
+        if not self.is_ready():
+            return False
+        try:
+            await self._open_stream_async()
+            return True
+        except Exception as e:
+            print(f"Connection warmup failed: {e}")
+            return False
+
+    def _recently_reached(self) -> bool:
+        """Whether the server answered within the last probe_ttl seconds"""
+        reached_at = self._reached_at
+        return reached_at is not None and time.time() - reached_at < self._probe_ttl
+
+    def _note_reachable(self, reachable: bool) -> bool:
+        """Record the outcome of a probe or send, returns it unchanged"""
+        self._reached_at = time.time() if reachable else None
+        return reachable
+
+    def _reachable(self, status_code: int) -> bool:
+        """Whether a status code shows the endpoint is reachable"""
+        # Accept 405 (Method Not Allowed) as a valid response since we're testing connectivity
+        # Accept 401/403 as valid connection but auth issue
+        return _is_2xx(status_code) or status_code in (401, 403, 405)
+
+    @_native
     def send_data(self, payload) -> dict:
         """
         Send data to server via HTTP POST
@@ -152,26 +354,110 @@ class HttpAdapter(TransmissionPort):
         Returns:
             Dict with status information
         """
-        if not self.is_ready():
-            return {"success": False, "error": "Network not connected"}
+        json_data, result = self._prepare(payload)
+        if result is not None:
+            return result
 
+        result = self._post(json_data)
+        if result["success"]:
+            # The link is up again, deliver what was held back
+            self._note_reachable(True)
+            self._drain()
+        else:
+            self._hold_back(json_data, result)
+        return result
+
+    def send_batch(self, payloads: list) -> dict:
+        """
+        Send several payloads back to back over the kept-alive connection
+
+        The API takes one reading per request, so a batch is a run of POSTs
+        sharing one TCP/TLS session. Payloads that cannot be delivered go to
+        the outbox like single sends.
+
+        Args:
+            payloads: List of dictionaries containing data to send
+
+        Returns:
+            Dict with overall success, the number sent and per-payload results
+        """
+        results = [self.send_data(payload) for payload in payloads]
+        sent = sum([1 for result in results if result["success"]])
+        return {"success": sent == len(results), "sent": sent, "results": results}
+
+    async def send_data_async(self, payload) -> dict:
+        """
+        Coroutine variant of send_data
+
+        Args:
+            payload: Dictionary containing data to send
+
+        Returns:
+            Dict with status information
+        """
+        json_data, result = self._prepare(payload)
+        if result is not None:
+            return result
+
+        result = await self._post_async(json_data)
+        if result["success"]:
+            self._note_reachable(True)
+            await self._drain_async()
+        else:
+            self._hold_back(json_data, result)
+        return result
+
+    def _prepare(self, payload):
+        """
+        Serialize a payload and check the link
+
+        Returns:
+            (json_data, None) when the payload should be posted now, or
+            (json_data, result) when send_data must return result right away
+        """
         try:
-            # Convert payload to JSON
-            json_data = json.dumps(payload)
+            # Convert payload to JSON bytes once, retries and outbox drains
+            # write the same buffer without serializing or encoding again
+            json_data = _dumps(payload).encode()
+        except Exception as e:
+            return None, {"success": False, "error": str(e)}
+
+        if self._compress and len(json_data) >= _MIN_COMPRESS:
+            try:
+                json_data = _gzip(json_data)
+            except Exception as e:
+                # Firmware without deflate compression, send plain JSON
+                print(f"Compression failed, sending uncompressed: {e}")
+                self._compress = False
 
-            # Print debug information
-            print(f"Request Headers: {self._headers}")
-            print(f"Payload Preview: {str(json_data)[:100]}...")
-            print(f"Full endpoint: {self._readings_endpoint}")
+        if not self.is_ready():
+            self._enqueue(json_data)
+            return json_data, {
+                "success": False,
+                "error": "Network not connected",
+                "queued": True,
+            }
+        return json_data, None
 
+    def _hold_back(self, json_data: bytes, result: dict):
+        """Queue a payload whose POST failed in a retryable way"""
+        if self._should_retry(result):
+            self._note_reachable(False)
+            self._enqueue(json_data)
+            result["queued"] = True
+
+    @property
+    def pending(self) -> int:
+        """Number of payloads waiting in the outbox"""
+        return len(self._outbox)
+
+    def _post(self, json_data: bytes) -> dict:
+        """POST one serialized payload to the readings endpoint"""
+        try:
             # Send POST request to the readings endpoint
-            print(f"Sending POST data to {self._readings_endpoint}")
-            response = request.post(
-                self._readings_endpoint,
-                headers=self._headers,
-                data=json_data,
-                timeout=self._timeout,
-            )
+            if HttpAdapter.DEBUG:
+                print(self._send_log)
+            response = self._send_request("POST", json_data)
 
             # Process and validate the response
             return self.validate_response(response)
@@ -180,6 +466,321 @@ class HttpAdapter(TransmissionPort):
             print(f"Error sending data: {e}")
             return {"success": False, "error": str(e)}
 
+    async def _post_async(self, json_data: bytes) -> dict:
+        """Coroutine variant of _post"""
+        try:
+            if HttpAdapter.DEBUG:
+                print(self._send_log)
+            response = await self._send_request_async("POST", json_data)
+            return self.validate_response(response)
+        except Exception as e:
+            print(f"Error sending data: {e}")
+            return {"success": False, "error": str(e)}
+
+    def _should_retry(self, result: dict) -> bool:
+        """Transport failures and server errors are retried, client errors are not"""
+        status_code = result.get("status_code")
+        return status_code is None or status_code >= 500
+
+    def _enqueue(self, json_data: bytes):
+        """Hold a payload back, dropping the oldest one when the outbox is full"""
+        if len(self._outbox) >= self._max_queue:
+            self._outbox.pop(0)
+            self._outbox.append(json_data)
+            self._spool(self._outbox, "wb")
+        else:
+            self._outbox.append(json_data)
+            self._spool((json_data,), "ab")
+
+    def _drain(self):
+        """Send queued payloads oldest first until one fails again"""
+        outbox = self._outbox
+        sent = False
+        while outbox:
+            result = self._post(outbox[0])
+            if not result["success"] and self._should_retry(result):
+                break
+            outbox.pop(0)
+            sent = True
+        if sent:
+            self._spool(outbox, "wb")
+
+    async def _drain_async(self):
+        """Coroutine variant of _drain"""
+        outbox = self._outbox
+        sent = False
+        while outbox:
+            result = await self._post_async(outbox[0])
+            if not result["success"] and self._should_retry(result):
+                break
+            outbox.pop(0)
+            sent = True
+        if sent:
+            self._spool(outbox, "wb")
+
+    def _spool(self, records, mode: str):
+        """
+        Write outbox records to the spool file as 2-byte length + payload
+
+        Appends for a newly queued payload and rewrites after drops or
+        deliveries. A failed write only costs persistence, the RAM outbox
+        stays authoritative.
+        """
+        if self._spool_path is None:
+            return
+        try:
+            with open(self._spool_path, mode) as spool:
+                for record in records:
+                    spool.write(len(record).to_bytes(2, "big"))
+                    spool.write(record)
+        except OSError as e:
+            print(f"Outbox spool write failed: {e}")
+
+    def _load_spool(self):
+        """Reload the payloads a previous run could not deliver"""
+        try:
+            with open(self._spool_path, "rb") as spool:
+                data = spool.read()
+        except OSError:
+            return
+        offset = 0
+        end = len(data)
+        while offset + 2 <= end:
+            size = int.from_bytes(data[offset : offset + 2], "big")
+            offset += 2
+            if offset + size > end:
+                # Record torn by a reset mid-write
+                break
+            self._outbox.append(data[offset : offset + size])
+            offset += size
+        self._outbox = self._outbox[-self._max_queue :]
+
+    def close(self):
+        """Close the kept-alive connections"""
+        self._close_sock()
+        self._close_stream()
+
+    def _close_sock(self):
+        """Close the kept-alive blocking socket"""
+        sock = self._sock
+        self._sock = None
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError as e:
+                if HttpAdapter.DEBUG:
+                    print(f"Closing socket failed: {e}")
+
+    def _close_stream(self):
+        """Close the kept-alive asyncio stream"""
+        stream = self._stream
+        self._stream = None
+        if stream is not None:
+            try:
+                stream[1].close()
+            except OSError as e:
+                if HttpAdapter.DEBUG:
+                    print(f"Closing stream failed: {e}")
+
+    def _connect(self):
+        """Open the TCP connection, wrapped in TLS for https endpoints"""
+        # Only one TLS session is held at a time, each costs tens of KB of RAM
+        self._close_stream()
+        if self._address is None:
+            # Resolve once, DNS lookups are slow on the device
+            self._address = socket.getaddrinfo(
+                self._host, self._port, 0, socket.SOCK_STREAM
+            )[0][-1]
+        sock = socket.socket()
+        try:
+            sock.settimeout(self._timeout)
+            sock.connect(self._address)
+            if self._tls:
+                sock = ssl.wrap_socket(sock, server_hostname=self._host)
+        except Exception:
+            sock.close()
+            self._address = None
+            raise
+        self._sock = sock
+        return sock
+
+    def _send_request(self, method: str, body=None) -> _Response:
+        """
+        Send one request over the kept-alive connection
+
+        A reused connection the server has dropped in the meantime is
+        reopened once when writing the request fails. Once the request is
+        written, or on a timeout, the error is raised: the server may
+        already have stored the reading, so sending it again could
+        duplicate it.
+
+        Args:
+            method: HTTP method
+            body: Optional request body (str or bytes)
+
+        Returns:
+            _Response with the status code and bounded body
+        """
+        head = self._request_heads[method]
+        body, length = self._frame_body(body)
+
+        while True:
+            reused = self._sock is not None
+            sock = self._sock if reused else self._connect()
+            written = False
+            try:
+                sock.write(head)
+                sock.write(length)
+                if body:
+                    sock.write(body)
+                written = True
+                return self._read_response(sock)
+            except OSError as e:
+                self.close()
+                if written or not reused or e.errno == errno.ETIMEDOUT:
+                    raise
+            except Exception:
+                self.close()
+                raise
+
+    async def _send_request_async(self, method: str, body=None) -> _Response:
+        """
+        Coroutine variant of _send_request using an asyncio stream
+
+        Retries on a fresh stream under the same rule as _send_request.
+
+        Args:
+            method: HTTP method
+            body: Optional request body (str or bytes)
+
+        Returns:
+            _Response with the status code and bounded body
+        """
+        head = self._request_heads[method]
+        body, length = self._frame_body(body)
+
+        while True:
+            reused = self._stream is not None
+            if not reused:
+                await self._open_stream_async()
+            reader, writer = self._stream
+            written = False
+            try:
+                writer.write(head)
+                writer.write(length)
+                if body:
+                    writer.write(body)
+                await writer.drain()
+                written = True
+                return await asyncio.wait_for(
+                    self._read_response_async(reader), self._timeout
+                )
+            except OSError as e:
+                self._close_stream()
+                if written or not reused or e.errno == errno.ETIMEDOUT:
+                    raise
+            except Exception:
+                self._close_stream()
+                raise
+
+    async def _open_stream_async(self):
+        """Open the asyncio stream to the endpoint within the timeout"""
+        # Only one TLS session is held at a time, each costs tens of KB of RAM
+        self._close_sock()
+        self._stream = await asyncio.wait_for(
+            asyncio.open_connection(
+                self._host, self._port, ssl=True if self._tls else None
+            ),
+            self._timeout,
+        )
+
+    def _frame_body(self, body):
+        """Return the body as bytes and its Content-Length header line"""
+        if body is None:
+            body = b""
+        elif type(body) is str:
+            body = body.encode()
+        length = b"Content-Length: %d\r\n\r\n" % len(body)
+        if body[:2] == _GZIP_MAGIC:
+            # JSON never starts with these bytes, so queued compressed bodies
+            # are recognised without tracking a flag per payload
+            length = b"Content-Encoding: gzip\r\n" + length
+        return body, length
+
+    def _read_response(self, sock) -> _Response:
+        """Parse status line, headers and body, keeping at most _MAX_BODY bytes"""
+        head = _ResponseHead(sock.readline())
+        while head.feed(sock.readline()):
+            pass
+
+        # Success bodies are drained but not kept, only the status matters
+        limit = 0 if _is_2xx(head.status_code) else _MAX_BODY
+        body = b""
+        if head.chunked:
+            while True:
+                size = int(sock.readline().split(b";")[0], 16)
+                if not size:
+                    sock.readline()
+                    break
+                body = self._read_into(sock, size, body, limit)
+                sock.readline()
+        elif head.length:
+            body = self._read_into(sock, head.length, body, limit)
+
+        if not head.keep_alive:
+            self.close()
+        return _Response(head.status_code, body)
+
+    async def _read_response_async(self, reader) -> _Response:
+        """Coroutine variant of _read_response"""
+        head = _ResponseHead(await reader.readline())
+        while head.feed(await reader.readline()):
+            pass
+
+        # Success bodies are drained but not kept, only the status matters
+        limit = 0 if _is_2xx(head.status_code) else _MAX_BODY
+        body = b""
+        if head.chunked:
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if not size:
+                    await reader.readline()
+                    break
+                body = await self._read_into_async(reader, size, body, limit)
+                await reader.readline()
+        elif head.length:
+            body = await self._read_into_async(reader, head.length, body, limit)
+
+        if not head.keep_alive:
+            self._close_stream()
+        return _Response(head.status_code, body)
+
+    def _read_into(self, sock, size: int, body: bytes, limit: int) -> bytes:
+        """Consume size bytes from sock, appending to body up to limit bytes"""
+        while size > 0:
+            data = sock.read(min(size, _MAX_BODY))
+            if not data:
+                raise OSError("Connection closed by server")
+            size -= len(data)
+            room = limit - len(body)
+            if room > 0:
+                body += data[:room]
+        return body
+
+    async def _read_into_async(
+        self, reader, size: int, body: bytes, limit: int
+    ) -> bytes:
+        """Coroutine variant of _read_into"""
+        while size > 0:
+            data = await reader.read(min(size, _MAX_BODY))
+            if not data:
+                raise OSError("Connection closed by server")
+            size -= len(data)
+            room = limit - len(body)
+            if room > 0:
+                body += data[:room]
+        return body
+
     def validate_response(self, response) -> dict:
         """
         Validate the response from the server.
@@ -191,23 +792,33 @@ class HttpAdapter(TransmissionPort):
         try:
             # Process response
             status_code = response.status_code
-            success = 200 <= status_code < 300
-
-            # Get response body
+            success = _is_2xx(status_code)
+            if success:
+                # A stored reading needs nothing from the body
+                response.close()
+                return {"success": True, "status_code": status_code, "data": {}}
+
+            # Get response body, bounded so a large error page cannot
+            # exhaust the heap
             try:
-                response_data = response.json()
-            except ValueError:
-                # If not JSON, get the text content
+                body = response.content
+            except Exception:
+                body = None
+            finally:
+                response.close()
+
+            if body is None:
+                response_data = {"error": "Could not read response body"}
+            else:
                 try:
-                    response_text = response.text
+                    response_data = json.loads(body)
+                except ValueError:
+                    # If not JSON, keep the text content
+                    response_text = body.decode()
                     response_data = {"text": response_text}
                     # If we got a 400 error, this is the error message
                     if status_code == 400 and response_text:
                         response_data["error"] = response_text
-                except Exception:
-                    response_data = {"error": "Could not read response body"}
-
-            response.close()
 
             # Return result with better error info
             result = {
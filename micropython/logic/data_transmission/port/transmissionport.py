@@ -6,42 +6,29 @@ must adhere to, following the Ports and Adapters pattern.
 """
 
 try:
-    from typing import Dict, Any
+    from typing import Dict, Any, List
 except ImportError:
     pass
 
-try:
-    # Use mock abc module when running on ESP32
-    from modules.mock_abc import ABC, abstractmethod  # type: ignore
-except ImportError:
-    # Use real abc module when running on CI/CD pipeline
-    from abc import ABC, abstractmethod  # type: ignore
-
 
-class TransmissionPort(ABC):
+class TransmissionPort:
     """
-    Base abstract interface that all data transmission services must implement.
+    Base interface that all data transmission services must implement.
 
     This is the "port" in the ports and adapters pattern that defines
     the contract between the application and transmission implementations.
-    """
-
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Get the transmission service name"""
-        raise NotImplementedError("Abstract method")
+    It is a plain class rather than an ABC because adapters are used on the
+    send path of every reading; unimplemented methods raise
+    NotImplementedError when called.
 
-    @property
-    @abstractmethod
-    def endpoint(self) -> str:
-        """
-        Get the server base endpoint URL.
+    Attributes:
+        name: The transmission service name
+        endpoint: The server base endpoint URL
+    """
 
-        """
-        raise NotImplementedError("Abstract method")
+    name = None
+    endpoint = None
 
-    @abstractmethod
     def is_ready(self) -> bool:
         """
         Check if the transmission service is ready to send data
@@ -51,7 +38,6 @@ class TransmissionPort(ABC):
         """
         raise NotImplementedError("Abstract method")
 
-    @abstractmethod
     def test_connection(self) -> bool:
         """
         Test connectivity to the server
@@ -61,7 +47,6 @@ class TransmissionPort(ABC):
         """
         raise NotImplementedError("Abstract method")
 
-    @abstractmethod
     def send_data(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         Send data to the server
@@ -74,7 +59,18 @@ class TransmissionPort(ABC):
         """
         raise NotImplementedError("Abstract method")
 
-    @abstractmethod
+    def send_batch(self, payloads: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Send several payloads in one go
+
+        Args:
+            payloads: List of dictionaries containing the data to send
+
+        Returns:
+            Dict[str, Any]: Combined response information
+        """
+        raise NotImplementedError("Abstract method")
+
     def validate_response(self, response: Dict[str, Any]) -> dict:
         """
         Validate the server response
@@ -86,3 +82,42 @@ class TransmissionPort(ABC):
             dict: Validation result
         """
         raise NotImplementedError("Abstract method")
+
+
+class AsyncTransmissionPort(TransmissionPort):
+    """
+    Transmission interface that also offers coroutine variants.
+
+    Lets the application send data from a uasyncio task without blocking
+    sensor sampling or other tasks during DNS, TCP/TLS and response waits.
+    """
+
+    async def test_connection_async(self) -> bool:
+        """
+        Coroutine variant of test_connection
+
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        raise NotImplementedError("Abstract method")
+
+    async def send_data_async(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Coroutine variant of send_data
+
+        Args:
+            payload: Dictionary containing the data to send
+
+        Returns:
+            Dict[str, Any]: Response information
+        """
+        raise NotImplementedError("Abstract method")
+
+    async def warmup_async(self) -> bool:
+        """
+        Establish the connection ahead of the next send_data_async
+
+        Returns:
+            bool: True if the connection is open, False otherwise
+        """
+        raise NotImplementedError("Abstract method")
@@ -33,9 +33,11 @@ class ApiHttpService:
         self,
         name: str,
         endpoint: str,
+        device_id: str,
         api_key: Optional[str] = None,
         headers: Optional[Dict[str, str]] = None,
         timeout: int = 10,
+        spool_path: Optional[str] = None,
     ):
         """
         Initialize the API HTTP service
@@ -43,12 +45,19 @@ class ApiHttpService:
         Args:
             name: Name for this transmission service
             endpoint: Full URL of API endpoint (without the path)
+            device_id: Fixed device identifier added to metadata that lacks one
             api_key: API key for X-API-Key header authentication as specified in the OpenAPI spec
             headers: Additional HTTP headers to include
             timeout: Request timeout in seconds
+            spool_path: Flash file keeping undelivered payloads across reboots
+
+        Raises:
+            ValueError: If device_id is empty
         """
-        self._http_adapter = HttpAdapter(name, endpoint, api_key, headers, timeout)
-        self._contract_adapter = ApiContractAdapter()
+        self._http_args = (name, endpoint, api_key, headers, timeout)
+        self._spool_path = spool_path
+        self._http_adapter = HttpAdapter(*self._http_args, spool_path=spool_path)
+        self._contract_adapter = ApiContractAdapter(device_id)
         self._name = name
         self._readings_endpoint = f"{endpoint.rstrip('/')}"
 
@@ -69,12 +78,77 @@ class ApiHttpService:
         """Test server connection to the readings endpoint"""
         return self._http_adapter.test_connection()
 
+    async def warmup_async(self):
+        """Open the HTTP adapter's connection ahead of send_data_async"""
+        return await self._http_adapter.warmup_async()
+
+    def close(self):
+        """Close the HTTP adapter's kept-alive connection"""
+        self._http_adapter.close()
+
+    def reset_transport(self):
+        """
+        Recreate the HTTP adapter while keeping the contract adapter
+
+        The contract adapter and its compiled validator hold no connection
+        state, so a transport reset only needs a fresh HttpAdapter.
+        """
+        self._http_adapter.close()
+        self._http_adapter = HttpAdapter(*self._http_args, spool_path=self._spool_path)
+        return self._http_adapter
+
+    def build_payload(
+        self,
+        hyt221: dict,
+        ina219_1: dict,
+        ina219_2: dict,
+        metadata: dict,
+        trusted: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Build a SensorReading payload without sending it
+
+        Args:
+            trusted: Skip payload validation for readings built by our own sensor code
+
+        Returns:
+            Dictionary: Sensor reading payload
+
+        Raises:
+            ValueError: If the payload violates the API contract
+        """
+        if trusted:
+            # Self-generated readings are sent without a second validation
+            return self._contract_adapter.create_sensor_payload_fast(
+                hyt221, ina219_1, ina219_2, metadata
+            )
+        # Validate the payload against the API contract
+        return self._contract_adapter.create_sensor_payload(
+            hyt221=hyt221,
+            ina219_1=ina219_1,
+            ina219_2=ina219_2,
+            metadata=metadata,
+        )
+
+    def send_batch(self, payloads: list) -> Dict[str, Any]:
+        """
+        Send payloads built by build_payload over one kept-alive connection
+
+        Args:
+            payloads: List of SensorReading payloads
+
+        Returns:
+            Dict with overall success, the number sent and per-payload results
+        """
+        return self._http_adapter.send_batch(payloads)
+
     def send_data(
         self,
         hyt221: dict,
         ina219_1: dict,
         ina219_2: dict,
         metadata: dict,
+        trusted: bool = False,
     ) -> Dict[str, Any]:
         """
         Validate and send data to server via HTTP POST
@@ -84,14 +158,14 @@ class ApiHttpService:
 
         Args:
             payload: Dictionary containing sensor data that must conform to the SensorReading schema
+            trusted: Skip payload validation for readings built by our own sensor code
 
         Returns:
             Dict with status information including success and any response data
         """
         try:
-            # Validate the payload against the API contract
-            validated_payload = self._contract_adapter.create_sensor_payload(
-                hyt221=hyt221, ina219_1=ina219_1, ina219_2=ina219_2, metadata=metadata
+            validated_payload = self.build_payload(
+                hyt221, ina219_1, ina219_2, metadata, trusted
             )
 
             # Send the validated payload using the HTTP adapter
@@ -100,6 +174,32 @@ class ApiHttpService:
         except ValueError as e:
             return {"success": False, "error": f"API contract validation error: {e}"}
 
+    async def send_data_async(
+        self,
+        hyt221: dict,
+        ina219_1: dict,
+        ina219_2: dict,
+        metadata: dict,
+        trusted: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Coroutine variant of send_data
+
+        Args:
+            trusted: Skip payload validation for readings built by our own sensor code
+
+        Returns:
+            Dict with status information including success and any response data
+        """
+        try:
+            validated_payload = self.build_payload(
+                hyt221, ina219_1, ina219_2, metadata, trusted
+            )
+        except ValueError as e:
+            return {"success": False, "error": f"API contract validation error: {e}"}
+
+        return await self._http_adapter.send_data_async(validated_payload)
+
     def validate_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate the response from the API request
@@ -11,18 +11,44 @@ This module handles the main execution flow including:
 -- Data transmission
 """
 
+import gc
 import time
+import asyncio
 import network  # type: ignore
+from machine import I2C, Pin, lightsleep  # type: ignore
+from micropython import const  # type: ignore
 from modules.secure_storage import SecureStorage  # type: ignore
-from modules.wifi import connect_wifi  # type: ignore
+from modules.wifi import connect_wifi, connect_wifi_async  # type: ignore
 from modules.memory_manager import MemoryManager  # type: ignore
 from data_collection.adapter.hyt221 import HYT221Adapter  # type: ignore
 from data_collection.adapter.ina219 import INA219Adapter  # type: ignore
 from data_transmission.service.api_http_service import ApiHttpService  # type: ignore
 import ntptime  # type: ignore - Add NTP time module
 
+# Bound once at import: the timestamp path runs every monitoring cycle
+_now = time.time
+
+# Board wiring and timing, folded into the bytecode as immediates
+_SCL = const(11)
+_SDA = const(12)
+_BAT_I2C = const(0x41)
+_PV_I2C = const(0x45)
+_HT_I2C = const(0x28)
+_I2C_FREQ = const(400_000)
+_COLLECTION_INTERVAL_S = const(180)
+
+# Flash file holding readings the API has not accepted yet
+_OUTBOX_PATH = "/outbox.bin"
+
+# Placeholder for a sensor that never became ready; shared, never mutated
+_READ_FAILED = {"measurements": {"error": "sensor_read_failed"}}
+
 
 class Main:
+    # Per-cycle progress output, off by default: print is a blocking UART
+    # write on the device. Warnings and errors are always printed.
+    DEBUG = False
+
     def __init__(self):
         """Initialize the Main class with default values"""
         self.device_id = None
@@ -36,23 +62,27 @@ class Main:
         self.api_key = None
         self.sensors = None
         self.collection_interval = None
-        self.scl = None
-        self.sda = None
-        self.bat_i2c = None
-        self.pv_i2c = None
-        self.hum_and_temp_i2c = None
+        self.batch_size = None
+        self.light_sleep = None
+        self._batch_limit = 1
+        self._pending = []
+        self._wifi_backoff = 0
+        self.i2c = None
         self.battery = None
         self.pv = None
         self.hum_and_temp = None
         self.api_client = None
+        self.metadata = None
         self.timezone_offset = 0  # Default timezone offset
 
     def setup(self):
         """Complete setup process for the ESP32 system"""
         print("Starting ESP32 Air Quality Monitoring System Setup...")
+        MemoryManager.configure()
 
         # Run setup methods in order
         self.variable_setup()
+        self.metadata_setup()
         self.wifi_setup()
         self.time_setup()
         self.api_setup()
@@ -61,6 +91,19 @@ class Main:
 
         print("✅ Setup complete! Starting main monitoring loop...")
 
+    def metadata_setup(self):
+        """Build the metadata dict once; each cycle only updates its fields"""
+        # device_id is set here once, so the API client never has to copy
+        # the dict to add it
+        self.metadata = {
+            "device_id": self.device_id,
+            "timestamp": 0,
+            "timestamp_epoch": "micropython",  # or "2000-01-01"
+            "location": self.location,
+            "version": self.version,
+            "http_client_reset": "No",
+        }
+
     def variable_setup(self):
         ########################################################
         # Variable setup
@@ -83,12 +126,14 @@ class Main:
             self.api_key: str = None
             # Initialize system parameters
             self.sensors: dict = None
-            self.collection_interval: int = 180  # seconds
-            self.scl: int = 11
-            self.sda: int = 12
-            self.bat_i2c: int = 0x41
-            self.pv_i2c: int = 0x45
-            self.hum_and_temp_i2c: int = 0x28
+            self.collection_interval: int = _COLLECTION_INTERVAL_S
+            # Readings per POST burst; above 1 trades latency for fewer wake-ups
+            self.batch_size: int = 1
+            # Sleep the CPU and radio between cycles instead of idling awake.
+            # Off by default: the API connection is closed before every sleep,
+            # so each cycle pays a new TLS handshake, and light sleep can drop
+            # the native-USB REPL on the Nano ESP32
+            self.light_sleep: bool = False
 
         except Exception as e:
             print(f"Error initializing parameters: {e}")
@@ -98,64 +143,28 @@ class Main:
         ########################################################
         # WiFi setup
         ########################################################
-        if not self.wlan.isconnected():
-            print("Not connected to any network")
-            try:
-                try:
-                    # Retrieve WiFi credentials from secure storage
-                    self.ssid, self.password = self.storage.get_wifi_credentials()
-                except Exception as e:
-                    print(f"Failed to retrieve WiFi credentials: {e}")
-                if self.ssid and self.password:
-                    # If credentials are found, try to connect to WiFi
-                    print(f"Credentials found: {self.ssid}")
-                    try:
-                        print("Trying to connect to Wifi")
-                        self.wlan, self.ssid = connect_wifi(self.ssid, self.password)
-                        time.sleep(3)
-                        if not self.wlan.isconnected():
-                            raise Exception("Failed to get WiFi connection details")
-                    except Exception as e:
-                        print(f"Error: {e}")
-                else:
-                    # If credentials are not found, prompt user to enter them trying to connect to wifi
-                    print("WiFi credentials not found in secure storage")
-                    try:
-                        # Prompt user to enter WiFi credentials
-                        try:
-                            self.storage.prompt_and_store_wifi_credentials()
-                        except Exception as e:
-                            print(f"Failed to store WiFi Credentials: {e}")
-                        try:
-                            self.ssid, self.password = (
-                                self.storage.get_wifi_credentials()
-                            )
-                        except Exception as e:
-                            print(f"Failed to retrieve WiFi credetnials: {e}")
-                        if self.ssid and self.password:
-                            try:
-                                # If credentials are found, try to connect to WiFi
-                                self.wlan, self.ssid = connect_wifi(
-                                    self.ssid, self.password
-                                )
-                                time.sleep(3)
-                                if not self.wlan.isconnected():
-                                    raise Exception(
-                                        "Failed to get WiFi connection details"
-                                    )
-                            except Exception as e:
-                                print(f"Error trying to connect to WiFi: {e}")
-                        else:
-                            raise Exception(
-                                "Failed to get WiFi credentials from secure storage"
-                            )
-                    except Exception as e:
-                        print(
-                            f"Error trying to set credentials and connect to WiFi: {e}"
-                        )
-
-            except Exception as e:
-                print(f"Error in the WiFi process: {e}")
+        if self.wlan.isconnected():
+            return
+        print("Not connected to any network")
+        # Stored credentials first, then prompt for new ones only if none exist
+        for prompt in (False, True):
+            if self._load_wifi_credentials(prompt):
+                print(f"Credentials found: {self.ssid}")
+                print("Trying to connect to Wifi")
+                self._connect_wifi()
+                return
+        print("Failed to get WiFi credentials from secure storage")
+
+    def _load_wifi_credentials(self, prompt):
+        """Fetch WiFi credentials, asking the user first if prompt is set"""
+        try:
+            if prompt:
+                print("WiFi credentials not found in secure storage")
+                self.storage.prompt_and_store_wifi_credentials()
+            self.ssid, self.password = self.storage.get_wifi_credentials()
+        except Exception as e:
+            print(f"Failed to get WiFi credentials: {e}")
+        return bool(self.ssid and self.password)
 
     def time_setup(self):
         ########################################################
@@ -211,7 +220,11 @@ class Main:
         try:
             # Create API service with contract validation
             self.api_client = ApiHttpService(
-                name="AirQualityAPI", endpoint=self.api_endpoint, api_key=self.api_key
+                name="AirQualityAPI",
+                endpoint=self.api_endpoint,
+                api_key=self.api_key,
+                device_id=self.device_id,
+                spool_path=_OUTBOX_PATH,
             )
             print("API client initialized successfully")
 
@@ -233,30 +246,36 @@ class Main:
         # Sensor setup
         ########################################################
         try:
+            # One hardware I2C bus at 400 kHz, shared by all sensors
+            self.i2c = I2C(0, scl=Pin(_SCL), sda=Pin(_SDA), freq=_I2C_FREQ)
+
             # Create sensor instances
             # Battery monitoring sensor
             self.battery = INA219Adapter(
                 sensor="ina219",
                 measurement="Battery",
-                i2c_address=self.bat_i2c,
-                scl=self.scl,
-                sda=self.sda,
+                i2c_address=_BAT_I2C,
+                scl=_SCL,
+                sda=_SDA,
+                i2c=self.i2c,
             )
             # Solar panel monitoring sensor
             self.pv = INA219Adapter(
                 sensor="ina219",
                 measurement="PV",
-                i2c_address=self.pv_i2c,
-                scl=self.scl,
-                sda=self.sda,
+                i2c_address=_PV_I2C,
+                scl=_SCL,
+                sda=_SDA,
+                i2c=self.i2c,
             )
             # Environmental sensor
             self.hum_and_temp = HYT221Adapter(
                 sensor="hyt221",
                 measurement="Humidity & Temperature",
-                i2c_address=self.hum_and_temp_i2c,
-                scl=self.scl,
-                sda=self.sda,
+                i2c_address=_HT_I2C,
+                scl=_SCL,
+                sda=_SDA,
+                i2c=self.i2c,
             )
 
             print("All sensor instances created.")
@@ -264,96 +283,114 @@ class Main:
         except Exception as e:
             print(f"Error creating sensors: {e}")
 
-    def _reconnect_wifi(self):
-        """Helper method to reconnect to WiFi"""
+    def _connect_wifi(self):
+        """Connect with the stored credentials, True once associated"""
+        try:
+            # connect_wifi polls until associated and raises on timeout
+            self.wlan, self.ssid = connect_wifi(self.ssid, self.password)
+            return True
+        except Exception as e:
+            print(f"Error trying to connect to WiFi: {e}")
+            return False
+
+    async def _reconnect_wifi(self):
+        """Helper method to reconnect to WiFi without blocking the event loop"""
         if self.ssid and self.password:
+            print("Trying to reconnect to WiFi")
             try:
-                print("Trying to reconnect to WiFi")
-                self.wlan, self.ssid = connect_wifi(self.ssid, self.password)
-                time.sleep(3)
-                if self.wlan.isconnected():
-                    print(f"Reconnected to: {self.ssid}")
-                    return True
-                else:
-                    print("Failed to reconnect to WiFi")
-                    return False
+                self.wlan, self.ssid = await connect_wifi_async(
+                    self.ssid, self.password
+                )
+                print(f"Reconnected to: {self.ssid}")
+                return True
             except Exception as e:
-                print(f"Error reconnecting to WiFi: {e}")
+                print(f"Failed to reconnect to WiFi: {e}")
                 return False
         else:
             print("Missing WiFi credentials for reconnection!")
             return False
 
-    def _collect_sensor_data(self):
-        """Helper method to collect data from all sensors"""
-        sleep_time = 0.25
-        sensor_readings = {}
-        sensors = {
-            "battery_data": self.battery,
-            "pv_data": self.pv,
-            "hnt_data": self.hum_and_temp,
-        }
-
-        for key, sensor_obj in sensors.items():
-            try:
-                data = {"measurements": {"error": "sensor_read_failed"}}
-                for i in range(3):
-                    if sensor_obj.is_ready():
-                        data = sensor_obj.read()
-                        break
-                    time.sleep(sleep_time)
-                sensor_readings[key] = data
+    def _set_power_save(self, enabled):
+        """Switch WiFi power saving, firmware without pm support is left alone"""
+        try:
+            wlan = self.wlan
+            wlan.config(pm=wlan.PM_POWERSAVE if enabled else wlan.PM_NONE)
+        except (AttributeError, ValueError, OSError):
+            pass
+
+    async def _read_with_retry(self, sensor, deadline_ms=750):
+        """Read a sensor as soon as it reports ready, giving up after deadline_ms"""
+        start = time.ticks_ms()
+        while time.ticks_diff(time.ticks_ms(), start) < deadline_ms:
+            if sensor.is_ready():
+                return sensor.read()
+            # Yield so the connection warmup progresses while we wait
+            await asyncio.sleep_ms(10)
+        return _READ_FAILED
+
+    async def _read_sensor(self, key, sensor_obj):
+        """Read one sensor for _collect_sensor_data, reporting errors as data"""
+        try:
+            data = await self._read_with_retry(sensor_obj)
+            if Main.DEBUG:
                 print(f"Sensor {key} data: {data}")
+            return data
 
-            except Exception as e:
-                print(f"Error reading sensor {key}: {e}")
-                sensor_readings[key] = {
-                    "measurements": {"error": f"sensor_read_failed: {e}"}
-                }
-
-        return sensor_readings
+        except Exception as e:
+            print(f"Error reading sensor {key}: {e}")
+            return {"measurements": {"error": f"sensor_read_failed: {e}"}}
 
-    def _send_sensor_data(self, sensor_data, current_time):
+    async def _collect_sensor_data(self):
+        """Helper method to collect data from all sensors"""
+        # The readiness waits of the three sensors overlap; each bus
+        # transaction itself is synchronous, so they never interleave
+        keys = ("battery_data", "pv_data", "hnt_data")
+        readings = await asyncio.gather(
+            self._read_sensor(keys[0], self.battery),
+            self._read_sensor(keys[1], self.pv),
+            self._read_sensor(keys[2], self.hum_and_temp),
+        )
+        return dict(zip(keys, readings))
+
+    async def _send_sensor_data(self, sensor_data, current_time):
         """Helper method to send sensor data to API with retry logic"""
         try:
             battery_data = sensor_data.get("battery_data", {})
             pv_data = sensor_data.get("pv_data", {})
             hnt_data = sensor_data.get("hnt_data", {})
 
-            metadata = {
-                "device_id": self.device_id,
-                "timestamp": current_time,
-                "timestamp_epoch": "micropython",  # or "2000-01-01"
-                "location": self.location,
-                "version": self.version,
-                "http_client_reset": "No",
-            }
+            metadata = self.metadata
+            metadata["timestamp"] = current_time
+            metadata["http_client_reset"] = "No"
 
             for attempt in range(3):
                 try:
-                    response = self.api_client.send_data(
+                    response = await self.api_client.send_data_async(
                         hyt221=hnt_data,
                         ina219_1=battery_data,
                         ina219_2=pv_data,
                         metadata=metadata,
+                        trusted=True,
                     )
                     return response
                 except Exception as e:
                     print(f"Error sending data to API (attempt {attempt + 1}): {e}")
                     if attempt < 2:
-                        time.sleep(5)
+                        await asyncio.sleep(5)
                     else:
-                        # Last attempt - try reinitializing HTTP client
+                        # Last attempt - reset the HTTP transport, the
+                        # contract adapter is kept for the whole run
                         try:
-                            self.http_client_instance()
+                            self.api_client.reset_transport()
                             print("API client re-initialized for final attempt")
                             metadata["http_client_reset"] = "Yes"
                             # Retry sending data after reinitialization
-                            response = self.api_client.send_data(
+                            response = await self.api_client.send_data_async(
                                 hyt221=hnt_data,
                                 ina219_1=battery_data,
                                 ina219_2=pv_data,
                                 metadata=metadata,
+                                trusted=True,
                             )
                             return response
                         except Exception as reset_error:
@@ -370,77 +407,169 @@ class Main:
             print(f"Error in _send_sensor_data: {e}")
             return {"success": False, "error": str(e)}
 
-    def main(self):
+    async def _batch_sensor_data(self, sensor_data, current_time):
+        """
+        Buffer a reading and send the buffered batch once it is full
+
+        The batch limit adapts between 1 and batch_size: it grows by one after
+        a fully delivered batch and halves after a failure, so readings go
+        out sooner while the link is unreliable. Each reading is sent through
+        _send_sensor_data, so batches get the same retry and transport reset
+        as single readings. Undelivered payloads are kept in the HTTP
+        adapter's outbox.
+
+        Returns:
+            The batch result, or None while the reading is only buffered
+        """
+        self._pending.append((sensor_data, current_time))
+        if len(self._pending) < self._batch_limit:
+            if Main.DEBUG:
+                print(f"Buffered reading {len(self._pending)}/{self._batch_limit}")
+            return None
+
+        pending = self._pending
+        self._pending = []
+        sent = 0
+        error = None
+        for readings, timestamp in pending:
+            response = await self._send_sensor_data(readings, timestamp)
+            if response.get("success", False):
+                sent += 1
+            else:
+                error = response.get("error")
+        if sent == len(pending):
+            self._batch_limit = min(self.batch_size, self._batch_limit + 1)
+            return {"success": True, "sent": sent}
+        self._batch_limit = max(1, self._batch_limit // 2)
+        return {
+            "success": False,
+            "sent": sent,
+            "error": f"{len(pending) - sent} of {len(pending)} readings failed: {error}",
+        }
+
+    async def main(self):
         ########################################################
         # -- MAIN LOOP --
         ########################################################
-        while True:
-            try:
-                print("\n--- Starting monitoring cycle ---")
-
-                # Display WiFi status
-                if self.wlan.isconnected():
-                    print(f"Connected to: {self.ssid}")
-                else:
-                    print("Not connected to any network")
-                    if not self._reconnect_wifi():
-                        print("WiFi reconnection failed, skipping this cycle")
-                        time.sleep(30)
-                        continue
-
-                ########################################################
-                # DATA COLLECTION
-                ########################################################
+        try:
+            while True:
                 try:
-                    sensor_readings = self._collect_sensor_data()
-                except Exception as e:
-                    print(f"Error in sensor data collection: {e}")
-                    continue
+                    if Main.DEBUG:
+                        print("\n--- Starting monitoring cycle ---")
 
-                ################################################
-                # DATA TRANSMISSION
-                ################################################
-                try:
-                    # Send API POST request
-                    print("Build and send API Request")
-                    # Get current time with timezone adjustment if needed
-                    current_time = int(time.time()) + getattr(
-                        self, "timezone_offset", 0
-                    )
+                    # Display WiFi status
+                    if self.wlan.isconnected():
+                        if Main.DEBUG:
+                            print(f"Connected to: {self.ssid}")
+                    else:
+                        print("Not connected to any network")
+                        if not await self._reconnect_wifi():
+                            # Retry after 1, 2, 4 ... seconds, capped at a minute,
+                            # so a short dropout is bridged quickly
+                            delay = min(60, 1 << self._wifi_backoff)
+                            print(f"WiFi reconnection failed, retrying in {delay}s")
+                            self._wifi_backoff = min(self._wifi_backoff + 1, 6)
+                            await asyncio.sleep(delay)
+                            continue
+                        self._wifi_backoff = 0
+
+                    # Stamp the cycle once, when the sensors are sampled, with
+                    # timezone adjustment if needed. time.time() already
+                    # returns an int on the ESP32 port
+                    now = _now()
+                    if type(now) is not int:
+                        now = int(now)
+                    current_time = now + self.timezone_offset
+
+                    # Keep the radio fully awake from connection setup to the
+                    # last response; power save adds DTIM latency per packet
+                    self._set_power_save(False)
+
+                    # Resolve and connect to the API while the sensors are
+                    # read, on every cycle that ends with a send
+                    warmup = None
+                    if len(self._pending) + 1 >= self._batch_limit:
+                        warmup = asyncio.create_task(self.api_client.warmup_async())
+
+                    ########################################################
+                    # DATA COLLECTION
+                    ########################################################
+                    try:
+                        sensor_readings = await self._collect_sensor_data()
+                    except Exception as e:
+                        print(f"Error in sensor data collection: {e}")
+                        self._set_power_save(True)
+                        continue
+                    finally:
+                        if warmup is not None:
+                            await warmup
+
+                    ################################################
+                    # DATA TRANSMISSION
+                    ################################################
+                    # Collect now, while nothing is in flight, so a GC pass
+                    # does not stall the request and response
+                    gc.collect()
+                    try:
+                        # Send API POST request
+                        if Main.DEBUG:
+                            print("Build and send API Request")
+                        if self.batch_size > 1:
+                            response = await self._batch_sensor_data(
+                                sensor_readings, current_time
+                            )
+                        else:
+                            response = await self._send_sensor_data(
+                                sensor_readings, current_time
+                            )
 
-                    response = self._send_sensor_data(sensor_readings, current_time)
+                        # validate the response; the remaining fields are
+                        # only looked up for the branch that prints them
+                        if response is not None:
+                            result = self.api_client.validate_response(response)
+                            get = result.get
+                            if get("success", False):
+                                if Main.DEBUG:
+                                    print(f"API request successful: {get('data')}")
+                            else:
+                                print(
+                                    f"API request failed ({get('status_code', 'n/a')}): "
+                                    f"{get('error', 'Unknown error')}"
+                                )
 
-                    # validate the response
-                    validate_response = self.api_client.validate_response(response)
-                    if validate_response.get("success", False):
-                        print(
-                            f"API request successful: {validate_response.get('data', {})}"
-                        )
-                    else:
-                        error_msg = validate_response.get("error", "Unknown error")
-                        status = validate_response.get("status_code", "n/a")
-                        print(f"API request failed ({status}): {error_msg}")
+                    except Exception as e:
+                        print(f"Error in 'DATA TRANSMISSION': {e}")
+                        # Short delay after errors to prevent rapid retries
+                        await asyncio.sleep(5)
 
-                except Exception as e:
-                    print(f"Error in 'DATA TRANSMISSION': {e}")
-                    # Short delay after errors to prevent rapid retries
-                    time.sleep(5)
+                    ################################################
+                    # POST PROCESSING
+                    ################################################
+                    try:
+                        self._set_power_save(True)
+                        if Main.DEBUG:
+                            MemoryManager.show_memory_info()
+                            print(
+                                f"Waiting {self.collection_interval} seconds before next reading cycle..."
+                            )
+                        if self.light_sleep:
+                            # The radio is off while asleep, so the kept-alive
+                            # connection would not survive; close it cleanly
+                            # rather than fail the first write after waking
+                            self.api_client.close()
+                            lightsleep(self.collection_interval * 1000)
+                        else:
+                            await asyncio.sleep(self.collection_interval)
+                    except Exception as e:
+                        print(f"Error in 'POST PROCESSING': {e}")
 
-                ################################################
-                # POST PROCESSING
-                ################################################
-                try:
-                    MemoryManager.show_memory_info()
-                    print(
-                        f"Waiting {self.collection_interval} seconds before next reading cycle..."
-                    )
-                    time.sleep(self.collection_interval)
                 except Exception as e:
-                    print(f"Error in 'POST PROCESSING': {e}")
-
-            except Exception as e:
-                print(f"Error in --MAIN LOOP--: {e}")
-                time.sleep(5)
+                    print(f"Error in --MAIN LOOP--: {e}")
+                    await asyncio.sleep(5)
+        finally:
+            # Release the kept-alive API connection when the loop is left
+            if self.api_client is not None:
+                self.api_client.close()
 
 
 if __name__ == "__main__":
@@ -448,7 +577,7 @@ if __name__ == "__main__":
         try:
             main = Main()
             main.setup()
-            main.main()
+            asyncio.run(main.main())
         except Exception as e:
             print(f"Fatal error: {e}")
             time.sleep(60)
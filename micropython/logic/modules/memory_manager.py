@@ -4,11 +4,16 @@ import gc
 
 class MemoryManager:
     @staticmethod
-    def cleanup():
+    def configure():
+        # Collect automatically once another quarter of the free heap has
+        # been allocated, so collections are spread out rather than bunched
         gc.collect()
-        import time
+        gc.threshold(gc.mem_free() // 4)
 
-        time.sleep(0.1)
+    @staticmethod
+    def cleanup():
+        # gc.collect() is synchronous, callers need not sleep afterwards
+        gc.collect()
 
     @staticmethod
     def show_memory_info():
@@ -8,6 +8,33 @@ for handling sensitive data including secure memory cleanup and input validation
 
 import esp32 as nvs  # type: ignore
 
+from micropython import const  # type: ignore
+
+# Credential length limits, folded into the bytecode as immediates
+_SSID_MAX = const(32)
+_PWD_MIN = const(8)
+_PWD_MAX = const(64)
+_API_KEY_LEN = const(40)
+_API_ENDPOINT_MAX = const(84)
+
+# Zeros copied over sensitive buffers; covers the longest credential field
+_ZEROS = memoryview(bytes(_API_ENDPOINT_MAX))
+
+
+def _decode(buffer, length):
+    """Decode the first length bytes NVS wrote, without copying the buffer"""
+    return str(memoryview(buffer)[:length], "utf-8")
+
+
+def _stage(buffer, value):
+    """Copy value's UTF-8 bytes into buffer and return a view of just them"""
+    data = value.encode()
+    if len(data) > len(buffer):
+        raise ValueError(f"Value must be {len(buffer)} bytes or less in UTF-8")
+    view = memoryview(buffer)[: len(data)]
+    view[:] = data
+    return view
+
 
 class SecureStorage:
     """
@@ -25,11 +52,11 @@ class SecureStorage:
         namespace (str): NVS namespace for storing credentials
     """
 
-    SSID_MAX_LENGTH = 32
-    PASSWORD_MIN_LENGTH = 8
-    PASSWORD_MAX_LENGTH = 64
-    API_KEY_LENGTH = 40
-    API_ENDPOINT_LENGTH = 84
+    SSID_MAX_LENGTH = _SSID_MAX
+    PASSWORD_MIN_LENGTH = _PWD_MIN
+    PASSWORD_MAX_LENGTH = _PWD_MAX
+    API_KEY_LENGTH = _API_KEY_LEN
+    API_ENDPOINT_LENGTH = _API_ENDPOINT_MAX
 
     def __init__(self, namespace: str = "wifi"):
         """
@@ -40,6 +67,12 @@ class SecureStorage:
         """
         self.namespace = namespace
         self._nvs = nvs.NVS(namespace)
+        # Read buffers reused by every retrieval; only the bytes get_blob
+        # reports are decoded, and secrets are cleared after each use
+        self._ssid_buf = bytearray(_SSID_MAX)
+        self._pwd_buf = bytearray(_PWD_MAX)
+        self._api_key_buf = bytearray(_API_KEY_LEN)
+        self._api_endpoint_buf = bytearray(_API_ENDPOINT_MAX)
 
     def _validate_wifi_credentials(self, ssid: str, password: str):
         """
@@ -52,24 +85,20 @@ class SecureStorage:
         Raises:
             ValueError: If credentials fail validation
         """
-        if not isinstance(ssid, str) or not isinstance(password, str):
+        if type(ssid) is not str or type(password) is not str:
             raise ValueError("Credentials must be strings")
 
-        if not ssid or len(ssid.strip()) == 0:
+        if not ssid.strip():
             raise ValueError("SSID cannot be empty")
 
-        if len(ssid) > self.SSID_MAX_LENGTH:
-            raise ValueError(f"SSID must be {self.SSID_MAX_LENGTH} characters or less")
+        if len(ssid) > _SSID_MAX:
+            raise ValueError(f"SSID must be {_SSID_MAX} characters or less")
 
-        if len(password) < self.PASSWORD_MIN_LENGTH:
-            raise ValueError(
-                f"Password must be at least {self.PASSWORD_MIN_LENGTH} characters"
-            )
+        if len(password) < _PWD_MIN:
+            raise ValueError(f"Password must be at least {_PWD_MIN} characters")
 
-        if len(password) > self.PASSWORD_MAX_LENGTH:
-            raise ValueError(
-                f"Password must be {self.PASSWORD_MAX_LENGTH} characters or less"
-            )
+        if len(password) > _PWD_MAX:
+            raise ValueError(f"Password must be {_PWD_MAX} characters or less")
 
     def _validate_api_credentials(self, api_key: str, api_endpoint: str):
         """
@@ -83,23 +112,21 @@ class SecureStorage:
             ValueError: If credentials fails validation
         """
         # Validate API key
-        if not isinstance(api_key, str):
+        if type(api_key) is not str:
             raise ValueError("API key must be a string")
-        if not api_key or len(api_key.strip()) == 0:
+        if not api_key.strip():
             raise ValueError("API key cannot be empty")
-        if len(api_key) != self.API_KEY_LENGTH:
-            raise ValueError(
-                f"API key must be exactly {self.API_KEY_LENGTH} characters"
-            )
+        if len(api_key) != _API_KEY_LEN:
+            raise ValueError(f"API key must be exactly {_API_KEY_LEN} characters")
 
         # Validate API endpoint
-        if not isinstance(api_endpoint, str):
+        if type(api_endpoint) is not str:
             raise ValueError("API endpoint must be a string")
-        if not api_endpoint or len(api_endpoint.strip()) == 0:
+        if not api_endpoint.strip():
             raise ValueError("API endpoint cannot be empty")
-        if len(api_endpoint) > self.API_ENDPOINT_LENGTH:
+        if len(api_endpoint) > _API_ENDPOINT_MAX:
             raise ValueError(
-                f"API endpoint must be {self.API_ENDPOINT_LENGTH} characters or less"
+                f"API endpoint must be {_API_ENDPOINT_MAX} characters or less"
             )
 
     def _secure_clear(self, buffer: bytearray) -> None:
@@ -112,8 +139,27 @@ class SecureStorage:
         This method overwrites the buffer with zeros to ensure
         sensitive data is not left in memory.
         """
-        for i in range(len(buffer)):
-            buffer[i] = 0
+        # One slice assignment copies in place in C instead of a Python loop
+        n = len(buffer)
+        buffer[:] = _ZEROS[:n] if n <= len(_ZEROS) else bytes(n)
+
+    def _blob_equals(self, key: str, buffer: bytearray, value: str) -> bool:
+        """
+        Check whether NVS already holds value under key.
+
+        Args:
+            key (str): NVS key to compare
+            buffer (bytearray): Pooled read buffer for this key
+            value (str): Value about to be stored
+
+        Returns:
+            bool: True if the stored blob decodes to value, False if it
+            differs or cannot be read
+        """
+        try:
+            return _decode(buffer, self._nvs.get_blob(key, buffer)) == value
+        except Exception:
+            return False
 
     def store_wifi_credentials(self, ssid: str, password: str):
         """
@@ -129,31 +175,32 @@ class SecureStorage:
         Raises:
             ValueError: If credentials are invalid
         """
-        pwd_encoded = None
         try:
             self._validate_wifi_credentials(ssid, password)
 
-            # Encode credentials
-            ssid_encoded = ssid.encode()
-            pwd_encoded = bytearray(password.encode())
-
-            # Store in NVS
-            self._nvs.set_blob("ssid", ssid_encoded)
-            self._nvs.set_blob("pwd", pwd_encoded)
-            self._nvs.commit()
+            # Store in NVS, skipping the flash write if nothing changed;
+            # values are encoded straight into the pooled buffers
+            dirty = False
+            if not self._blob_equals("ssid", self._ssid_buf, ssid):
+                self._nvs.set_blob("ssid", _stage(self._ssid_buf, ssid))
+                dirty = True
+            if not self._blob_equals("pwd", self._pwd_buf, password):
+                self._nvs.set_blob("pwd", _stage(self._pwd_buf, password))
+                dirty = True
+            if dirty:
+                self._nvs.commit()
 
             return True
 
         except ValueError as ve:
             print(f"Validation error: {ve}")
             return False
-        except Exception as e:
-            print(f"Storage error: {e}")
+        except OSError as e:
+            print("Storage error:", e)
             return False
         finally:
             # Securely clear sensitive data
-            if pwd_encoded:
-                self._secure_clear(pwd_encoded)
+            self._secure_clear(self._pwd_buf)
 
     def store_api_credentials(self, api_key: str, api_endpoint: str):
         """
@@ -169,36 +216,43 @@ class SecureStorage:
         Raises:
             ValueError: If API credentials are invalid
         """
-        api_key_encoded = None
         try:
             self._validate_api_credentials(api_key, api_endpoint)
 
+            dirty = False
+
             # API key
-            # Encode API key
-            api_key_encoded = bytearray(api_key.encode())
-            # Store in NVS
-            self._nvs.set_blob("api_key", api_key_encoded)
-            self._nvs.commit()
+            # Store in NVS unless it is already stored, encoded into the
+            # pooled buffer
+            if not self._blob_equals("api_key", self._api_key_buf, api_key):
+                self._nvs.set_blob("api_key", _stage(self._api_key_buf, api_key))
+                dirty = True
 
             # API endpoint
-            # Encode API endpoint
-            api_endpoint_encoded = bytearray(api_endpoint.encode())
-            # Store in NVS
-            self._nvs.set_blob("api_endpoint", api_endpoint_encoded)
-            self._nvs.commit()
+            # Store in NVS unless it is already stored
+            if not self._blob_equals(
+                "api_endpoint", self._api_endpoint_buf, api_endpoint
+            ):
+                self._nvs.set_blob(
+                    "api_endpoint", _stage(self._api_endpoint_buf, api_endpoint)
+                )
+                dirty = True
+
+            # One commit writes both keys to flash together
+            if dirty:
+                self._nvs.commit()
 
             return True
 
         except ValueError as ve:
             print(f"Validation error: {ve}")
             return False
-        except Exception as e:
-            print(f"Storage error: {e}")
+        except OSError as e:
+            print("Storage error:", e)
             return False
         finally:
             # Securely clear sensitive data
-            if api_key_encoded:
-                self._secure_clear(api_key_encoded)
+            self._secure_clear(self._api_key_buf)
 
     def get_wifi_credentials(self):
         """
@@ -210,30 +264,23 @@ class SecureStorage:
         Note:
             Sensitive data is securely cleared from memory after retrieval
         """
-        ssid_buffer = None
-        pwd_buffer = None
+        ssid_buffer = self._ssid_buf
+        pwd_buffer = self._pwd_buf
         try:
-            ssid_buffer = bytearray(self.SSID_MAX_LENGTH)
-            pwd_buffer = bytearray(self.PASSWORD_MAX_LENGTH)
-
             try:
-                self._nvs.get_blob("ssid", ssid_buffer)
-            except Exception as e:
-                print(f"Error retrieving SSID: {e}")
+                ssid_len = self._nvs.get_blob("ssid", ssid_buffer)
+            except OSError as e:
+                print("Error retrieving SSID:", e)
                 return None, None
             try:
-                self._nvs.get_blob("pwd", pwd_buffer)
-            except Exception as e:
-                print(f"Error retrieving wifi password: {e}")
+                pwd_len = self._nvs.get_blob("pwd", pwd_buffer)
+            except OSError as e:
+                print("Error retrieving wifi password:", e)
                 return None, None
 
             # Extract credentials before clearing buffers
-            ssid = ssid_buffer.decode().strip("\x00")
-            password = pwd_buffer.decode().strip("\x00")
-
-            # Securely clear sensitive data
-            if pwd_buffer:
-                self._secure_clear(pwd_buffer)
+            ssid = _decode(ssid_buffer, ssid_len)
+            password = _decode(pwd_buffer, pwd_len)
 
             if not ssid:
                 return None, None
@@ -244,9 +291,9 @@ class SecureStorage:
             print(f"Error retrieving credentials: {e}")
             return None, None
         finally:
-            # Ensure buffers are cleared even if an error occurs
-            if pwd_buffer:
-                self._secure_clear(pwd_buffer)
+            # The one wipe site, reached on success and error alike
+            # SSID is not sensitive; skip zeroization
+            self._secure_clear(pwd_buffer)
 
     def get_api_credentials(self):
         """
@@ -255,29 +302,25 @@ class SecureStorage:
         Returns:
             tuple: (api_key, api_endpoint) if successful, (None, None) if not found or error
         """
-        api_key_buffer = None
-        api_endpoint_buffer = None
+        api_key_buffer = self._api_key_buf
+        api_endpoint_buffer = self._api_endpoint_buf
         try:
-            api_key_buffer = bytearray(self.API_KEY_LENGTH)
-            api_endpoint_buffer = bytearray(self.API_ENDPOINT_LENGTH)
-
             try:
-                self._nvs.get_blob("api_key", api_key_buffer)
-            except Exception as e:
-                print(f"Error retrieving API key: {e}")
+                api_key_len = self._nvs.get_blob("api_key", api_key_buffer)
+            except OSError as e:
+                print("Error retrieving API key:", e)
                 return None, None
             try:
-                self._nvs.get_blob("api_endpoint", api_endpoint_buffer)
-            except Exception as e:
-                print(f"Error retrieving API endpoint: {e}")
+                api_endpoint_len = self._nvs.get_blob(
+                    "api_endpoint", api_endpoint_buffer
+                )
+            except OSError as e:
+                print("Error retrieving API endpoint:", e)
                 return None, None
 
             # Extract credentials
-            api_key = api_key_buffer.decode().strip("\x00")
-            api_endpoint = api_endpoint_buffer.decode().strip("\x00")
-
-            # Securely clear sensitive data
-            self._secure_clear(api_key_buffer)
+            api_key = _decode(api_key_buffer, api_key_len)
+            api_endpoint = _decode(api_endpoint_buffer, api_endpoint_len)
 
             if not api_key or not api_endpoint:
                 return None, None
@@ -288,11 +331,9 @@ class SecureStorage:
             print(f"Error retrieving API credentials: {e}")
             return None, None
         finally:
-            # Clear buffers
-            if api_key_buffer:
-                self._secure_clear(api_key_buffer)
-            if api_endpoint_buffer:
-                self._secure_clear(api_endpoint_buffer)
+            # The one wipe site, reached on success and error alike
+            self._secure_clear(api_key_buffer)
+            self._secure_clear(api_endpoint_buffer)
 
     def clear_wifi_credentials(self):
         """
@@ -307,7 +348,6 @@ class SecureStorage:
         # Try to clear SSID
         try:
             self._nvs.erase_key("ssid")
-            self._nvs.commit()
             success_count += 1
             print("SSID cleared successfully")
         except OSError as e:
@@ -323,7 +363,6 @@ class SecureStorage:
         # Try to clear password
         try:
             self._nvs.erase_key("pwd")
-            self._nvs.commit()
             success_count += 1
             print("WiFi password cleared successfully")
         except OSError as e:
@@ -336,6 +375,13 @@ class SecureStorage:
         except Exception as e:
             print(f"Unexpected error clearing WiFi password: {e}")
 
+        # One commit applies both erasures to flash
+        try:
+            self._nvs.commit()
+        except Exception as e:
+            print(f"Error committing NVS changes: {e}")
+            return False
+
         # Return True if both operations succeeded (or keys didn't exist)
         return success_count == total_keys
 
@@ -352,7 +398,6 @@ class SecureStorage:
         # Try to clear API key
         try:
             self._nvs.erase_key("api_key")
-            self._nvs.commit()
             success_count += 1
             print("API key cleared successfully")
         except OSError as e:
@@ -368,7 +413,6 @@ class SecureStorage:
         # Try to clear API endpoint
         try:
             self._nvs.erase_key("api_endpoint")
-            self._nvs.commit()
             success_count += 1
             print("API endpoint cleared successfully")
         except OSError as e:
@@ -381,6 +425,13 @@ class SecureStorage:
         except Exception as e:
             print(f"Unexpected error clearing API endpoint: {e}")
 
+        # One commit applies both erasures to flash
+        try:
+            self._nvs.commit()
+        except Exception as e:
+            print(f"Error committing NVS changes: {e}")
+            return False
+
         # Return True if both operations succeeded (or keys didn't exist)
         return success_count == total_keys
 
@@ -395,9 +446,9 @@ class SecureStorage:
             Provides feedback about password requirements to user
         """
         try:
-            print(f"SSID must be {self.SSID_MAX_LENGTH} characters or less")
             print(
-                f"Password must be between {self.PASSWORD_MIN_LENGTH} and {self.PASSWORD_MAX_LENGTH} characters"
+                f"SSID must be {_SSID_MAX} characters or less\n"
+                f"Password must be between {_PWD_MIN} and {_PWD_MAX} characters"
             )
 
             ssid = input("Enter WiFi SSID: ").strip()
@@ -423,9 +474,9 @@ class SecureStorage:
             Provides feedback about API credentials requirements to user
         """
         try:
-            print(f"API endpoint must be {self.API_ENDPOINT_LENGTH} characters.")
+            print(f"API endpoint must be {_API_ENDPOINT_MAX} characters.")
             api_endpoint = input("Enter API endpoint: ").strip()
-            print(f"API key must be exactly {self.API_KEY_LENGTH} characters.")
+            print(f"API key must be exactly {_API_KEY_LEN} characters.")
             api_key = input("Enter API Key: ").strip()
 
             if self.store_api_credentials(api_key=api_key, api_endpoint=api_endpoint):
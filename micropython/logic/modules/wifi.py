@@ -5,9 +5,15 @@ This module provides functions to establish and monitor WiFi connections
 on ESP32 devices running MicroPython.
 """
 
-import network  # type: ignore
+import asyncio
 import time
 
+import network  # type: ignore
+
+
+class WiFiConnectionError(Exception):
+    """Raised when the WiFi credentials are unusable or association fails"""
+
 
 def check_wifi_status(wlan):
     """
@@ -29,6 +35,73 @@ def check_wifi_status(wlan):
     return status
 
 
+def await_connection(wlan, timeout_ms: int = 20000) -> bool:
+    """
+    Wait for the WiFi interface to associate, polling every 100 ms.
+
+    Args:
+        wlan: network.WLAN instance representing the WiFi interface
+        timeout_ms (int): Maximum time to wait in milliseconds
+
+    Returns:
+        bool: True as soon as the interface is connected, False on timeout
+    """
+    start = time.ticks_ms()
+    while not wlan.isconnected():
+        if time.ticks_diff(time.ticks_ms(), start) >= timeout_ms:
+            return False
+        time.sleep_ms(100)
+    return True
+
+
+async def await_connection_async(wlan, timeout_ms: int = 20000) -> bool:
+    """
+    Coroutine variant of await_connection that yields between polls.
+
+    Args:
+        wlan: network.WLAN instance representing the WiFi interface
+        timeout_ms (int): Maximum time to wait in milliseconds
+
+    Returns:
+        bool: True as soon as the interface is connected, False on timeout
+    """
+    start = time.ticks_ms()
+    while not wlan.isconnected():
+        if time.ticks_diff(time.ticks_ms(), start) >= timeout_ms:
+            return False
+        await asyncio.sleep_ms(100)
+    return True
+
+
+def _reassociated(wlan) -> bool:
+    """Whether the interface is, or within a second becomes, associated"""
+    if wlan.isconnected():
+        return True
+    return wlan.status() == network.STAT_CONNECTING and await_connection(wlan, 1000)
+
+
+async def _reassociated_async(wlan) -> bool:
+    """Coroutine variant of _reassociated"""
+    if wlan.isconnected():
+        return True
+    return wlan.status() == network.STAT_CONNECTING and (
+        await await_connection_async(wlan, 1000)
+    )
+
+
+def _activate(ssid, password):
+    """Validate the credentials and return the active station interface"""
+    if not ssid or not password:
+        raise WiFiConnectionError("WiFi credentials not found in secure storage")
+
+    if not isinstance(ssid, str) or not isinstance(password, str):
+        raise WiFiConnectionError("WiFi credentials not a string")
+
+    wlan = network.WLAN(network.STA_IF)
+    wlan.active(True)
+    return wlan
+
+
 def connect_wifi(ssid: str, password: str):
     """
     Establish a WiFi connection using provided credentials.
@@ -41,32 +114,49 @@ def connect_wifi(ssid: str, password: str):
         tuple: (network.WLAN object, str) - The WiFi interface and connected SSID
 
     Raises:
-        Exception: If credentials are invalid or connection fails
+        WiFiConnectionError: If credentials are invalid or connection fails
     """
-    if not ssid or not password:
-        raise Exception("WiFi credentials not found in secure storage")
+    wlan = _activate(ssid, password)
 
-    if not isinstance(ssid, str) or not isinstance(password, str):
-        raise Exception("WiFi credentials not a string")
+    # Give an association already in progress up to a second to finish on
+    # its own; a cold boot with nothing stored connects right away
+    if not _reassociated(wlan):
+        print(f"Connecting to network: {ssid}...")
+        wlan.connect(ssid, password)
 
-    wlan = network.WLAN(network.STA_IF)
-    wlan.active(True)
+        # Wait for connection with timeout
+        if not await_connection(wlan):
+            check_wifi_status(wlan)
+            raise WiFiConnectionError("Failed to connect to WiFi")
 
-    time.sleep(1)
-    if not wlan.isconnected():
+    return wlan, ssid
+
+
+async def connect_wifi_async(ssid: str, password: str):
+    """
+    Coroutine variant of connect_wifi for use inside the event loop.
+
+    Args:
+        ssid (str): The name of the WiFi network to connect to
+        password (str): The password for the WiFi network
+
+    Returns:
+        tuple: (network.WLAN object, str) - The WiFi interface and connected SSID
+
+    Raises:
+        WiFiConnectionError: If credentials are invalid or connection fails
+    """
+    wlan = _activate(ssid, password)
+
+    # Give an association already in progress up to a second to finish on
+    # its own; a cold boot with nothing stored connects right away
+    if not await _reassociated_async(wlan):
         print(f"Connecting to network: {ssid}...")
         wlan.connect(ssid, password)
 
         # Wait for connection with timeout
-        max_wait = 10
-        while max_wait > 0:
+        if not await await_connection_async(wlan):
             check_wifi_status(wlan)
-            if wlan.isconnected():
-                break
-            max_wait -= 1
-            time.sleep(2)
-
-        if not wlan.isconnected():
-            raise Exception("Failed to connect to WiFi")
+            raise WiFiConnectionError("Failed to connect to WiFi")
 
     return wlan, ssid
@@ -0,0 +1,23 @@
+"""
+Frozen-firmware manifest for the sensor module
+
+Freezes the application packages and the downloaded libraries into a custom
+MicroPython build. Frozen modules are compiled to bytecode at build time and
+run straight from flash, so boot skips parsing them and their code does not
+take heap space that the TLS session needs.
+
+main.py stays on the filesystem and imports these modules as before; upload
+it with ``.\\upload.ps1 -MainOnly`` so no .py copies shadow the frozen ones.
+"""
+
+# ruff: noqa: F821 - include/package/module are provided by the build's manifest loader
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+# Application packages, same layout as on the device filesystem
+for package_name in ("modules", "data_collection", "data_transmission"):
+    package(package_name, base_path="logic", opt=3)
+
+# Third-party libraries fetched into libs/ by upload.ps1
+for library in ("ina219.py", "logging.py", "typing.py"):
+    module(library, base_path="libs", opt=3)
@@ -14,11 +14,20 @@
 .NOTES
     Requires Python with adafruit-ampy and pyserial packages.
     Compatible with Arduino Nano ESP32 and similar boards.
+.PARAMETER MainOnly
+    Upload only main.py, for firmware with the other modules frozen in (see manifest.py).
 .EXAMPLE
     ./upload.ps1
     # Executes the full upload process
+.EXAMPLE
+    ./upload.ps1 -MainOnly
+    # Uploads main.py to a board running the frozen firmware
 #>
 
+param(
+    [switch]$MainOnly
+)
+
 # Configuration
 $LOGIC_DIR = "./logic"
 $LIB_DIR = "./libs"
@@ -179,11 +188,13 @@ function Upload-Code {
     param($port, $orderedDirs)
 
     # Create directories on ESP32 - one by one without -p flag
+    # Frozen firmware already contains the packages, so no directories are needed
+    if ($MainOnly) { $dirsToCreate = @() } else { $dirsToCreate = $orderedDirs }
     Write-Host "Creating directory structure on ESP32..." -ForegroundColor Blue
 
     # Try to create individual directories without using -p flag
     # First create parent directories, then subdirectories
-    foreach ($dir in $orderedDirs) {
+    foreach ($dir in $dirsToCreate) {
         try {
             # First check if directory exists (suppress error since we expect it might not exist)
             Write-Host "Checking if directory exists: $dir" -ForegroundColor Blue
@@ -224,6 +235,12 @@ function Upload-Code {
         exit 1
     }
 
+    # Copies on the filesystem would shadow the frozen modules
+    if ($MainOnly) {
+        Write-Host "Frozen firmware: skipping module and library upload." -ForegroundColor Yellow
+        return
+    }
+
     # Process each directory's files
     foreach ($dir in $orderedDirs) {
         # Convert ESP32 path to local path
@@ -422,7 +439,9 @@ function Connect-REPL {
 # Main upload process
 try {
     Initialize-Python
-    Download-Libraries
+    if (-not $MainOnly) {
+        Download-Libraries
+    }
     $port = Get-ESP32Port
     Upload-Code $port $orderedDirs
     Reset-ESP32 $port
@@ -2,28 +2,34 @@
 Unit tests for API Contract Adapter functionality
 """
 
-import json
 import pytest
 import yaml
-import os
-from pathlib import Path
-from jsonschema import validate
+from jsonschema.validators import validator_for
 
 from micropython.logic.data_transmission.adapter.api_contract_adapter import (
     ApiContractAdapter,
 )  # type: ignore
 
-# Get the root directory of the project
-ROOT_DIR = Path(__file__).parent.parent.parent.parent
+# libyaml's C parser when PyYAML was built with it, the pure-Python one otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
-@pytest.fixture
-def openapi_spec_dict():
-    """Fixture to provide the OpenAPI specification as a dictionary"""
-    api_spec_path = os.path.join(ROOT_DIR, "api-spec.yaml")
-    with open(api_spec_path, "r") as f:
-        api_spec_dict = yaml.safe_load(f)
-    return api_spec_dict
+@pytest.fixture(scope="module")
+def openapi_spec_dict(project_root):
+    """Fixture to provide the OpenAPI specification as a dictionary, parsed once"""
+    # libyaml parses the raw bytes itself, no text-mode decoding in Python
+    api_spec_bytes = (project_root / "api-spec.yaml").read_bytes()
+    return yaml.load(api_spec_bytes, Loader=YAML_LOADER)
+
+
+@pytest.fixture(scope="module")
+def sensor_validator(openapi_spec_dict):
+    """Fixture to provide a SensorReading validator, built and checked once"""
+    sensor_schema = openapi_spec_dict["components"]["schemas"]["SensorReading"]
+    # Same draft selection as jsonschema.validate()
+    validator_cls = validator_for(sensor_schema)
+    validator_cls.check_schema(sensor_schema)
+    return validator_cls(sensor_schema)
 
 
 @pytest.fixture
@@ -75,10 +81,10 @@ def mock_metadata():
 
 
 # First, add a fixture for the ApiContractAdapter
-@pytest.fixture
+@pytest.fixture(scope="module")
 def api_contract_adapter():
     """Fixture to provide an instance of ApiContractAdapter"""
-    return ApiContractAdapter()
+    return ApiContractAdapter(device_id="esp32-001")
 
 
 def test_create_sensor_payload_schema_validation(
@@ -86,11 +92,11 @@ def test_create_sensor_payload_schema_validation(
     mock_ina219_1_data,
     mock_ina219_2_data,
     mock_metadata,
-    openapi_spec_dict,
+    sensor_validator,
 ):
     """Test that created payload conforms to the API schema"""
     # Create a payload with the adapter
-    adapter = ApiContractAdapter()
+    adapter = ApiContractAdapter(device_id="esp32-001")
 
     payload = adapter.create_sensor_payload(
         hyt221=mock_hyt221_data,
@@ -99,15 +105,8 @@ def test_create_sensor_payload_schema_validation(
         metadata=mock_metadata,
     )
 
-    # Print the payload for debugging
-    print("\nGenerated payload:")
-    print(json.dumps(payload, indent=2))
-
-    # Get the SensorReading schema directly from the dict
-    sensor_schema = openapi_spec_dict["components"]["schemas"]["SensorReading"]
-
-    # Validate using jsonschema directly
-    validate(instance=payload, schema=sensor_schema)
+    # Validate against the SensorReading schema
+    sensor_validator.validate(payload)
 
     # Additional specific assertions
     assert payload["measurements"]["temperature"] == 23.5
@@ -160,3 +159,62 @@ def test_create_sensor_payload_with_missing_data(
             ina219_2=None,
             metadata=mock_metadata,
         )
+
+
+def test_create_sensor_payload_fast_matches_validated_payload(
+    api_contract_adapter,
+    mock_hyt221_data,
+    mock_ina219_1_data,
+    mock_ina219_2_data,
+    mock_metadata,
+):
+    """Test that the unchecked fast path builds the same payload"""
+    kwargs = {
+        "hyt221": mock_hyt221_data,
+        "ina219_1": mock_ina219_1_data,
+        "ina219_2": mock_ina219_2_data,
+        "metadata": mock_metadata,
+    }
+
+    assert api_contract_adapter.create_sensor_payload_fast(
+        **kwargs
+    ) == api_contract_adapter.create_sensor_payload(**kwargs)
+
+
+def test_create_sensor_payload_fast_validates_failed_sensor_reading(
+    api_contract_adapter, mock_ina219_1_data, mock_ina219_2_data, mock_metadata
+):
+    """Test that a failed sensor read is not built into an unchecked payload"""
+    with pytest.raises(ValueError, match="humidity, temperature"):
+        api_contract_adapter.create_sensor_payload_fast(
+            hyt221={"measurements": {"error": "sensor_read_failed"}},
+            ina219_1=mock_ina219_1_data,
+            ina219_2=mock_ina219_2_data,
+            metadata=mock_metadata,
+        )
+
+
+def test_create_sensor_payload_uses_cached_device_id(
+    mock_hyt221_data, mock_ina219_1_data, mock_ina219_2_data, mock_metadata
+):
+    """Test that the device id given at construction fills in missing metadata"""
+    adapter = ApiContractAdapter(device_id="esp32-002")
+    del mock_metadata["device_id"]
+
+    payload = adapter.create_sensor_payload(
+        hyt221=mock_hyt221_data,
+        ina219_1=mock_ina219_1_data,
+        ina219_2=mock_ina219_2_data,
+        metadata=mock_metadata,
+    )
+
+    assert payload["metadata"]["device_id"] == "esp32-002"
+    # The caller's metadata dict is left untouched
+    assert "device_id" not in mock_metadata
+
+
+@pytest.mark.parametrize("device_id", [None, ""])
+def test_adapter_requires_device_id(device_id):
+    """Test that a missing device id is rejected at construction"""
+    with pytest.raises(ValueError):
+        ApiContractAdapter(device_id=device_id)
@@ -3,7 +3,7 @@ Unit tests for ApiHttpService
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 from micropython.logic.data_transmission.service.api_http_service import ApiHttpService
 
@@ -16,6 +16,24 @@ CONTRACT_ADAPTER_PATH = (
 )
 
 
+@pytest.fixture(scope="module")
+def _patched_adapter_classes():
+    """Patch both adapter classes once for the whole module"""
+    patchers = (patch(CONTRACT_ADAPTER_PATH), patch(HTTP_ADAPTER_PATH))
+    mock_classes = tuple(patcher.start() for patcher in patchers)
+    yield mock_classes
+    for patcher in patchers:
+        patcher.stop()
+
+
+@pytest.fixture
+def adapter_classes(_patched_adapter_classes):
+    """The patched (ApiContractAdapter, HttpAdapter) classes, reset for each test"""
+    for mock_class in _patched_adapter_classes:
+        mock_class.reset_mock(return_value=True)
+    return _patched_adapter_classes
+
+
 @pytest.fixture
 def test_data():
     """Test data for all tests"""
@@ -34,16 +52,14 @@ def test_data():
     }
 
 
-@patch(HTTP_ADAPTER_PATH)
-@patch(CONTRACT_ADAPTER_PATH)
-def test_api_http_service_initialization(
-    mock_contract_adapter_class, mock_http_adapter_class
-):
+def test_api_http_service_initialization(adapter_classes):
     """Test ApiHttpService initializes correctly"""
+    mock_contract_adapter_class, mock_http_adapter_class = adapter_classes
     # Execute
     service = ApiHttpService(
         name="TestService",
         endpoint="https://api.example.com/v1",
+        device_id="test-device-01",
         api_key="test-api-key",
     )
 
@@ -55,14 +71,11 @@ def test_api_http_service_initialization(
     assert mock_contract_adapter_class.called, "ApiContractAdapter was not called"
 
 
-@patch(HTTP_ADAPTER_PATH)
-@patch(CONTRACT_ADAPTER_PATH)
-def test_api_http_service_send_data_success(
-    mock_contract_adapter_class, mock_http_adapter_class, test_data
-):
+def test_api_http_service_send_data_success(adapter_classes, test_data):
     """Test successful data sending"""
+    mock_contract_adapter_class, mock_http_adapter_class = adapter_classes
     # Setup mocks
-    mock_http = MagicMock()
+    mock_http = Mock()
     mock_http.send_data.return_value = {
         "success": True,
         "status_code": 201,
@@ -70,7 +83,7 @@ def test_api_http_service_send_data_success(
     }
     mock_http_adapter_class.return_value = mock_http
 
-    mock_contract = MagicMock()
+    mock_contract = Mock()
     # Set return value for the method that's actually called
     mock_contract.create_sensor_payload.return_value = {"validated": "payload"}
     mock_contract_adapter_class.return_value = mock_contract
@@ -79,6 +92,7 @@ def test_api_http_service_send_data_success(
     service = ApiHttpService(
         name="TestService",
         endpoint="https://api.example.com/v1",
+        device_id="test-device-01",
         api_key="test-api-key",
     )
 
@@ -97,3 +111,78 @@ def test_api_http_service_send_data_success(
     assert mock_http.send_data.called, "send_data was not called"
     assert result["success"] is True
     assert result["status_code"] == 201
+
+
+def test_api_http_service_send_data_trusted_skips_validation(
+    adapter_classes, test_data
+):
+    """Test trusted sends build the payload without validating it"""
+    mock_contract_adapter_class, mock_http_adapter_class = adapter_classes
+    # Setup mocks
+    mock_http = Mock()
+    mock_http.send_data.return_value = {"success": True, "status_code": 201}
+    mock_http_adapter_class.return_value = mock_http
+
+    mock_contract = Mock()
+    mock_contract.create_sensor_payload_fast.return_value = {"trusted": "payload"}
+    mock_contract_adapter_class.return_value = mock_contract
+
+    # Create service
+    service = ApiHttpService(
+        name="TestService",
+        endpoint="https://api.example.com/v1",
+        device_id="test-device-01",
+        api_key="test-api-key",
+    )
+
+    # Execute
+    result = service.send_data(
+        ina219_1=test_data["ina219_1"],
+        ina219_2=test_data["ina219_2"],
+        hyt221=test_data["hyt221"],
+        metadata=test_data["metadata"],
+        trusted=True,
+    )
+
+    # Assert
+    assert not mock_contract.create_sensor_payload.called
+    mock_http.send_data.assert_called_once_with({"trusted": "payload"})
+    assert result["success"] is True
+
+
+def test_api_http_service_build_payload_then_send_batch(adapter_classes, test_data):
+    """Test payloads can be built up front and sent later as one batch"""
+    mock_contract_adapter_class, mock_http_adapter_class = adapter_classes
+    # Setup mocks
+    mock_http = Mock()
+    mock_http.send_batch.return_value = {"success": True, "sent": 2, "results": []}
+    mock_http_adapter_class.return_value = mock_http
+
+    mock_contract = Mock()
+    mock_contract.create_sensor_payload.return_value = {"validated": "payload"}
+    mock_contract_adapter_class.return_value = mock_contract
+
+    # Create service
+    service = ApiHttpService(
+        name="TestService",
+        endpoint="https://api.example.com/v1",
+        device_id="test-device-01",
+        api_key="test-api-key",
+    )
+
+    # Execute
+    payloads = [
+        service.build_payload(
+            hyt221=test_data["hyt221"],
+            ina219_1=test_data["ina219_1"],
+            ina219_2=test_data["ina219_2"],
+            metadata=test_data["metadata"],
+        )
+        for _ in range(2)
+    ]
+    assert not mock_http.send_data.called
+    result = service.send_batch(payloads)
+
+    # Assert
+    mock_http.send_batch.assert_called_once_with([{"validated": "payload"}] * 2)
+    assert result["sent"] == 2
@@ -0,0 +1,15 @@
+"""
+Shared fixtures for the MicroPython unit tests
+"""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def project_root():
+    """Fixture to provide the repository root, resolved once per session"""
+    # Anchored to this file rather than pytest's rootdir, which depends on
+    # how and from where pytest is invoked
+    return Path(__file__).resolve().parents[3]
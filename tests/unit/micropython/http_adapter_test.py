@@ -0,0 +1,305 @@
+"""
+Unit tests for HttpAdapter
+"""
+
+import asyncio
+import gzip
+import io
+from unittest.mock import patch
+
+import pytest
+
+from micropython.logic.data_transmission.adapter.http_adapter import HttpAdapter
+
+
+class FakeSocket:
+    """Socket stand-in replaying a canned HTTP response"""
+
+    def __init__(self, response: bytes):
+        self._stream = io.BytesIO(response)
+        self.written = b""
+        self.closed = False
+
+    def write(self, data):
+        self.written += data
+
+    def readline(self):
+        return self._stream.readline()
+
+    def read(self, size):
+        return self._stream.read(size)
+
+    def close(self):
+        self.closed = True
+
+
+def http_response(status_line: bytes, body: bytes = b"{}", extra: bytes = b""):
+    """Build raw HTTP response bytes"""
+    return (
+        status_line
+        + b"\r\nContent-Length: "
+        + str(len(body)).encode()
+        + b"\r\n"
+        + extra
+        + b"\r\n"
+        + body
+    )
+
+
+@pytest.fixture
+def adapter():
+    """HttpAdapter with a small outbox"""
+    return HttpAdapter(
+        name="TestService",
+        endpoint="https://api.example.com/v1/readings",
+        api_key="test-api-key",
+        headers=None,
+        max_queue=2,
+    )
+
+
+def test_send_data_queues_payload_when_offline(adapter):
+    """Test payloads are kept when the network is down"""
+    with patch.object(HttpAdapter, "is_ready", return_value=False):
+        result = adapter.send_data({"reading": 1})
+
+    assert result["success"] is False
+    assert result["queued"] is True
+    assert adapter.pending == 1
+
+
+def test_outbox_drops_oldest_payload_when_full(adapter):
+    """Test the outbox stays bounded"""
+    with patch.object(HttpAdapter, "is_ready", return_value=False):
+        for reading in range(3):
+            adapter.send_data({"reading": reading})
+
+    assert adapter.pending == 2
+    assert adapter._outbox[0] == b'{"reading":1}'
+
+
+def test_send_data_drains_outbox_after_success(adapter):
+    """Test queued payloads are sent once the link is back"""
+    with patch.object(HttpAdapter, "is_ready", return_value=False):
+        adapter.send_data({"reading": 1})
+
+    sock = FakeSocket(http_response(b"HTTP/1.1 201 Created") * 2)
+    adapter._sock = sock
+    with patch.object(HttpAdapter, "is_ready", return_value=True):
+        result = adapter.send_data({"reading": 2})
+
+    assert result["success"] is True
+    assert adapter.pending == 0
+    # Both requests went over the one kept-alive connection
+    assert adapter._sock is sock
+    assert sock.written.count(b"POST /v1/readings HTTP/1.1\r\n") == 2
+    assert b"X-API-Key: test-api-key\r\n" in sock.written
+
+
+def test_client_errors_are_not_queued(adapter):
+    """Test payloads rejected by the server are not retried"""
+    adapter._sock = FakeSocket(http_response(b"HTTP/1.1 400 Bad Request"))
+    with patch.object(HttpAdapter, "is_ready", return_value=True):
+        result = adapter.send_data({"reading": 1})
+
+    assert result["success"] is False
+    assert adapter.pending == 0
+
+
+def test_response_body_is_bounded(adapter):
+    """Test large error bodies are consumed but only partly kept"""
+    body = b"x" * 2000
+    sock = FakeSocket(http_response(b"HTTP/1.1 400 Bad Request", body))
+    adapter._sock = sock
+
+    response = adapter._send_request("POST", "{}")
+
+    assert response.status_code == 400
+    assert response.content == b"x" * 512
+    # The whole body was read off the socket, so it can be reused
+    assert sock.read(1) == b""
+    assert adapter._sock is sock
+
+
+def test_connection_close_drops_socket(adapter):
+    """Test a server-side close is honoured"""
+    sock = FakeSocket(
+        http_response(b"HTTP/1.1 201 Created", extra=b"Connection: close\r\n")
+    )
+    adapter._sock = sock
+
+    adapter._send_request("POST", "{}")
+
+    assert sock.closed is True
+    assert adapter._sock is None
+
+
+def test_written_request_is_not_resent(adapter):
+    """Test a reused socket failing after the write is not retried"""
+    sock = FakeSocket(b"")
+    adapter._sock = sock
+
+    with (
+        patch.object(HttpAdapter, "is_ready", return_value=True),
+        patch.object(HttpAdapter, "_connect") as connect,
+    ):
+        result = adapter.send_data({"reading": 1})
+
+    # The server may have stored the reading, so it goes to the outbox
+    connect.assert_not_called()
+    assert sock.written.count(b"POST ") == 1
+    assert result["queued"] is True
+    assert adapter.pending == 1
+
+
+def test_outbox_survives_restart_via_spool(tmp_path):
+    """Test queued payloads are reloaded from the spool file"""
+    spool = str(tmp_path / "outbox.bin")
+    kwargs = {
+        "name": "TestService",
+        "endpoint": "https://api.example.com/v1/readings",
+        "api_key": "test-api-key",
+        "headers": None,
+        "max_queue": 2,
+        "spool_path": spool,
+    }
+    first = HttpAdapter(**kwargs)
+    with patch.object(HttpAdapter, "is_ready", return_value=False):
+        for reading in range(3):
+            first.send_data({"reading": reading})
+
+    second = HttpAdapter(**kwargs)
+    assert second._outbox == [b'{"reading":1}', b'{"reading":2}']
+
+    second._sock = FakeSocket(http_response(b"HTTP/1.1 201 Created") * 3)
+    with patch.object(HttpAdapter, "is_ready", return_value=True):
+        second.send_data({"reading": 3})
+
+    assert HttpAdapter(**kwargs).pending == 0
+
+
+class FakeReader:
+    """asyncio StreamReader stand-in replaying a canned HTTP response"""
+
+    def __init__(self, response: bytes):
+        self._stream = io.BytesIO(response)
+
+    async def readline(self):
+        return self._stream.readline()
+
+    async def read(self, size):
+        return self._stream.read(size)
+
+
+class FakeWriter:
+    """asyncio StreamWriter stand-in collecting written bytes"""
+
+    def __init__(self):
+        self.written = b""
+
+    def write(self, data):
+        self.written += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_send_data_async_posts_over_stream(adapter):
+    """Test the coroutine variant sends over an asyncio stream"""
+    writer = FakeWriter()
+    adapter._stream = (FakeReader(http_response(b"HTTP/1.1 201 Created")), writer)
+
+    with patch.object(HttpAdapter, "is_ready", return_value=True):
+        result = asyncio.run(adapter.send_data_async({"reading": 1}))
+
+    assert result["success"] is True
+    assert result["status_code"] == 201
+    assert writer.written.startswith(b"POST /v1/readings HTTP/1.1\r\n")
+    assert writer.written.endswith(b'\r\n\r\n{"reading":1}')
+
+
+def test_warmup_replaces_blocking_socket(adapter):
+    """Test only one kept-alive connection is held at a time"""
+    sock = FakeSocket(b"")
+    adapter._sock = sock
+    stream = (FakeReader(b""), FakeWriter())
+
+    async def open_connection(*args, **kwargs):
+        return stream
+
+    with (
+        patch.object(HttpAdapter, "is_ready", return_value=True),
+        patch("asyncio.open_connection", open_connection),
+    ):
+        assert asyncio.run(adapter.warmup_async()) is True
+
+    assert sock.closed is True
+    assert adapter._sock is None
+    assert adapter._stream is stream
+
+
+def test_send_batch_shares_one_connection(adapter):
+    """Test a batch is sent as consecutive POSTs on the same socket"""
+    sock = FakeSocket(http_response(b"HTTP/1.1 201 Created") * 3)
+    adapter._sock = sock
+
+    with patch.object(HttpAdapter, "is_ready", return_value=True):
+        result = adapter.send_batch([{"reading": n} for n in range(3)])
+
+    assert result["success"] is True
+    assert result["sent"] == 3
+    assert adapter._sock is sock
+    assert sock.written.count(b"POST /v1/readings HTTP/1.1\r\n") == 3
+
+
+def test_large_bodies_are_gzipped_when_enabled():
+    """Test compression kicks in above the size threshold"""
+    adapter = HttpAdapter(
+        name="TestService",
+        endpoint="https://api.example.com/v1/readings",
+        api_key="test-api-key",
+        headers=None,
+        compress=True,
+    )
+    sock = FakeSocket(http_response(b"HTTP/1.1 201 Created") * 2)
+    adapter._sock = sock
+
+    with patch.object(HttpAdapter, "is_ready", return_value=True):
+        adapter.send_data({"reading": 1})
+        adapter.send_data({"location": "x" * 300})
+
+    small, large = sock.written.split(b"POST ")[1:]
+    assert b"Content-Encoding" not in small
+    assert b"Content-Encoding: gzip\r\n" in large
+    assert gzip.decompress(large.split(b"\r\n\r\n", 1)[1]) == (
+        b'{"location":"' + b"x" * 300 + b'"}'
+    )
+
+
+def test_success_body_is_drained_not_kept(adapter):
+    """Test 2xx bodies are consumed from the socket without being stored"""
+    sock = FakeSocket(http_response(b"HTTP/1.1 201 Created", b'{"id": "reading-1"}'))
+    adapter._sock = sock
+
+    response = adapter._send_request("POST", "{}")
+
+    assert response.status_code == 201
+    assert response.content == b""
+    assert sock.read(1) == b""
+
+
+def test_connection_probe_is_cached(adapter):
+    """Test a fresh successful probe is reused and a failed send clears it"""
+    adapter._sock = FakeSocket(http_response(b"HTTP/1.1 405 Method Not Allowed"))
+
+    with patch.object(HttpAdapter, "is_ready", return_value=True):
+        assert adapter.test_connection() is True
+        # Answered from the cache, the socket has nothing left to replay
+        assert adapter.test_connection() is True
+
+        adapter._sock = FakeSocket(http_response(b"HTTP/1.1 503 Unavailable"))
+        adapter.send_data({"reading": 1})
+        assert adapter._reached_at is None